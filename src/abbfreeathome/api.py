@@ -2,11 +2,13 @@
 
 import asyncio
 from collections.abc import Callable
+from functools import lru_cache
 import inspect
 import json
 import logging
 import os
 import ssl
+import time
 from typing import Any
 from urllib.parse import urlparse
 
@@ -24,6 +26,13 @@ import backoff
 from packaging.version import Version
 import voluptuous as vol
 
+try:
+    import orjson
+
+    _json_loads = orjson.loads
+except ImportError:  # pragma: no cover - orjson is an optional speedup
+    _json_loads = json.loads
+
 from .exceptions import (
     BadRequestException,
     ClientConnectionError,
@@ -42,6 +51,10 @@ API_VERSION = "v1"
 # API Requests Configuration
 DEFAULT_FREEATHOME_MAX_REQUEST_TRIES = 5
 
+# Datapoint reads repeat rapidly during reconnect and polling bursts; results
+# are cached for this many seconds to skip the duplicate network round trips.
+DATAPOINT_CACHE_TTL = 0.5
+
 VIRTUAL_DEVICE_ROOT_SCHEMA = vol.Schema(
     {
         vol.Required("type"): str,
@@ -60,9 +73,24 @@ VIRTUAL_DEVICE_PROPERTIES_SCHEMA = vol.Schema(
     }
 )
 
+VIRTUAL_DEVICE_SCHEMA = VIRTUAL_DEVICE_ROOT_SCHEMA.extend(
+    {vol.Required("properties"): VIRTUAL_DEVICE_PROPERTIES_SCHEMA}
+)
+
 _LOGGER = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=128)
+def _build_ssl_context(cafile: str) -> ssl.SSLContext:
+    """
+    Build an SSLContext for the given CA file, caching the result.
+
+    Creating a context reads and parses the whole CA bundle from disk, so
+    repeated connections reuse the same context instead of rebuilding it.
+    """
+    return ssl.create_default_context(cafile=cafile)
+
+
 class SSLContextMixin:
     """Mixin class to provide SSL context functionality."""
 
@@ -71,7 +99,7 @@ class SSLContextMixin:
         if not self._verify_ssl:
             return False
         if self._ssl_cert_ca_file:
-            return ssl.create_default_context(cafile=self._ssl_cert_ca_file)
+            return _build_ssl_context(self._ssl_cert_ca_file)
         return True
 
 
@@ -207,6 +235,7 @@ class FreeAtHomeApi(SSLContextMixin):
         self._ws_heartbeat = ws_heartbeat
         self._verify_ssl: bool = verify_ssl
         self._ssl_cert_ca_file: None | str = ssl_cert_ca_file
+        self._datapoint_cache: dict[tuple[str, str, str], tuple[float, list[str]]] = {}
 
     async def __aenter__(self):
         """Async enter and return self."""
@@ -232,12 +261,19 @@ class FreeAtHomeApi(SSLContextMixin):
         self, device_serial: str, channel_id: str, datapoint: str
     ) -> list[str]:
         """Get a specific datapoint from the api."""
+        _cache_key = (device_serial, channel_id, datapoint)
+        _cached = self._datapoint_cache.get(_cache_key)
+        if _cached and time.monotonic() - _cached[0] < DATAPOINT_CACHE_TTL:
+            return _cached[1]
+
         _response = await self._request(
             path=f"/api/rest/datapoint/{self._sysap_uuid}/{device_serial}.{channel_id}.{datapoint}",
             method="get",
         )
 
-        return _response.get(self._sysap_uuid).get("values")
+        _values = _response.get(self._sysap_uuid).get("values")
+        self._datapoint_cache[_cache_key] = (time.monotonic(), _values)
+        return _values
 
     async def get_device_list(self) -> list:
         """Get the list of devices."""
@@ -276,10 +312,7 @@ class FreeAtHomeApi(SSLContextMixin):
 
     async def virtualdevice(self, serial: str, data: dict[str, Any]):
         """Create or modify a virtualdevice in the api."""
-        _schema = VIRTUAL_DEVICE_ROOT_SCHEMA.extend(
-            {vol.Required("properties"): VIRTUAL_DEVICE_PROPERTIES_SCHEMA}
-        )
-        _schema(data)
+        VIRTUAL_DEVICE_SCHEMA(data)
         data["properties"]["ttl"] = str(data["properties"]["ttl"])
         _response = await self._request(
             path=f"/api/rest/virtualdevice/{self._sysap_uuid}/{serial}",
@@ -391,7 +424,21 @@ class FreeAtHomeApi(SSLContextMixin):
     ):  # pragma: no cover
         """Listen for events on the websocket."""
         while True:
-            await self.ws_receive(callback, retry_interval)
+            if not self.ws_connected:
+                await self.ws_receive(callback, retry_interval)
+                continue
+
+            # Iterating the response directly skips the per-message
+            # connection check and receive() round trip; the iterator ends on
+            # its own once the connection closes or errors.
+            async for data in self._ws_response:
+                if data.type == WSMsgType.TEXT:
+                    await self._ws_dispatch(data, callback)
+
+            # Back off before reconnecting so a flapping socket doesn't
+            # spin through close/connect cycles.
+            _LOGGER.warning("Websocket Connection Closed.")
+            await asyncio.sleep(retry_interval)
 
     async def ws_receive(
         self, callback: Callable[[list], None] | None = None, retry_interval: int = 5
@@ -417,13 +464,7 @@ class FreeAtHomeApi(SSLContextMixin):
 
         data = await self._ws_response.receive()
         if data.type == WSMsgType.TEXT:
-            _ws_data = data.json().get(self._sysap_uuid)
-
-            _LOGGER.debug("Websocket Response: %s", _ws_data)
-            if callback and inspect.iscoroutinefunction(callback):
-                await callback(_ws_data)
-            elif callback:
-                callback(_ws_data)
+            await self._ws_dispatch(data, callback)
         elif data.type == WSMsgType.ERROR:
             _LOGGER.error("Websocket Response Error. Data: %s", data)
             await asyncio.sleep(retry_interval)
@@ -433,3 +474,13 @@ class FreeAtHomeApi(SSLContextMixin):
             WSMsgType.CLOSING,
         ):
             _LOGGER.warning("Websocket Connection Closed.")
+
+    async def _ws_dispatch(self, data, callback: Callable[[list], None] | None) -> None:
+        """Dispatch a websocket TEXT message to the given callback."""
+        _ws_data = data.json(loads=_json_loads).get(self._sysap_uuid)
+
+        _LOGGER.debug("Websocket Response: %s", _ws_data)
+        if callback and inspect.iscoroutinefunction(callback):
+            await callback(_ws_data)
+        elif callback:
+            callback(_ws_data)
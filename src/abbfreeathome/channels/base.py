@@ -21,6 +21,21 @@ _LOGGER = logging.getLogger(__name__)
 class Base:
     """Free@Home Base Class."""
 
+    # Channels are instantiated once per device channel; slots keep the
+    # per-instance footprint small on large installations. Subclasses that
+    # declare no __slots__ of their own still get a __dict__ as usual.
+    __slots__ = (
+        "_device",
+        "_channel_id",
+        "_channel_name",
+        "_inputs",
+        "_outputs",
+        "_parameters",
+        "_floor_name",
+        "_room_name",
+        "_callbacks",
+    )
+
     _state_refresh_pairings: list[Pairing] = []
     _callback_attributes: list[str] = []
 
@@ -96,22 +111,24 @@ class Base:
 
     def get_input_by_pairing(self, pairing: Pairing) -> tuple[str, Any]:
         """Get the channel input by pairing id."""
+        _pairing_id = pairing.value
         for _input_id, _input in self._inputs.items():
-            if _input.get("pairingID") == pairing.value:
+            if _input.get("pairingID") == _pairing_id:
                 return _input_id, _input.get("value")
 
         raise InvalidDeviceChannelPairing(
-            self.device_serial, self.channel_id, pairing.value
+            self.device_serial, self.channel_id, _pairing_id
         )
 
     def get_output_by_pairing(self, pairing: Pairing) -> tuple[str, Any]:
         """Get the channel output by pairing id."""
+        _pairing_id = pairing.value
         for _output_id, _output in self._outputs.items():
-            if _output.get("pairingID") == pairing.value:
+            if _output.get("pairingID") == _pairing_id:
                 return _output_id, _output.get("value")
 
         raise InvalidDeviceChannelPairing(
-            self.device_serial, self.channel_id, pairing.value
+            self.device_serial, self.channel_id, _pairing_id
         )
 
     def get_channel_parameter(self, parameter: Parameter) -> tuple[str, Any]:
@@ -137,9 +154,10 @@ class Base:
         _io_key = datapoint_key.split("/")[-1]
 
         if _io_key in self._outputs:
-            self._outputs[_io_key]["value"] = datapoint_value
+            _output = self._outputs[_io_key]
+            _output["value"] = datapoint_value
             _callback_attribute = self._refresh_state_from_datapoint(
-                datapoint=self._outputs[_io_key]
+                _output.get("pairingID"), datapoint_value
             )
 
         if _callback_attribute and self._callbacks[_callback_attribute]:
@@ -183,19 +201,16 @@ class Base:
                 )
             )[0]
 
-            self._refresh_state_from_datapoint(
-                datapoint={
-                    "pairingID": _pairing.value,
-                    "value": _datapoint,
-                }
-            )
+            self._refresh_state_from_datapoint(_pairing.value, _datapoint)
 
     def _refresh_state_from_datapoints(self):
         """Refresh the state of the channel from the datapoints."""
         for _datapoint in self._outputs.values():
-            self._refresh_state_from_datapoint(_datapoint)
+            self._refresh_state_from_datapoint(
+                _datapoint.get("pairingID"), _datapoint.get("value")
+            )
 
-    def _refresh_state_from_datapoint(self, datapoint: dict[str, Any]) -> str:
+    def _refresh_state_from_datapoint(self, pairing_id: int, value: str) -> str:
         """Refresh the state of the channel from a single datapoint."""
 
     def __repr__(self) -> str:
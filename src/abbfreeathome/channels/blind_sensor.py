@@ -73,22 +73,22 @@ class BlindSensor(Base):
         """Get the move state property."""
         return self._move_state.name
 
-    def _refresh_state_from_datapoint(self, datapoint: dict[str, Any]) -> str:
+    def _refresh_state_from_datapoint(self, pairing_id: int, value: str) -> str:
         """
         Refresh the state of the channel from a given output.
 
         This will return the name of the attribute, which was refreshed or None.
         """
-        if datapoint.get("pairingID") == Pairing.AL_STOP_STEP_UP_DOWN.value:
+        if pairing_id == Pairing.AL_STOP_STEP_UP_DOWN.value:
             """
             Stops the sunblind and to step it up/down
 
             0 means up was pressed
             1 means down was pressed
             """
-            if datapoint.get("value") == "0":
+            if value == "0":
                 self._step_state = BlindSensorState.step_up
-            elif datapoint.get("value") == "1":
+            elif value == "1":
                 self._step_state = BlindSensorState.step_down
             else:
                 self._step_state = BlindSensorState.unknown
@@ -96,16 +96,16 @@ class BlindSensor(Base):
             self._state = self._step_state
             return "state"
 
-        if datapoint.get("pairingID") == Pairing.AL_MOVE_UP_DOWN.value:
+        if pairing_id == Pairing.AL_MOVE_UP_DOWN.value:
             """
             Moves sunblind up (0) and down (1)
 
             0 means up was pressed
             1 means down was pressed
             """
-            if datapoint.get("value") == "0":
+            if value == "0":
                 self._move_state = BlindSensorState.move_up
-            elif datapoint.get("value") == "1":
+            elif value == "1":
                 self._move_state = BlindSensorState.move_down
             else:
                 self._move_state = BlindSensorState.unknown
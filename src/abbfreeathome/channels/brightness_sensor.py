@@ -57,16 +57,16 @@ class BrightnessSensor(Base):
         """Get the alarm state of the sensor."""
         return self._alarm
 
-    def _refresh_state_from_datapoint(self, datapoint: dict[str, Any]) -> str:
+    def _refresh_state_from_datapoint(self, pairing_id: int, value: str) -> str:
         """
         Refresh the state of the channel from a given output.
 
         This will return the name of the attribute, which was refreshed or None.
         """
-        if datapoint.get("pairingID") == Pairing.AL_BRIGHTNESS_LEVEL.value:
-            self._state = float(datapoint.get("value"))
+        if pairing_id == Pairing.AL_BRIGHTNESS_LEVEL.value:
+            self._state = float(value)
             return "state"
-        if datapoint.get("pairingID") == Pairing.AL_BRIGHTNESS_ALARM.value:
-            self._alarm = datapoint.get("value") == "1"
+        if pairing_id == Pairing.AL_BRIGHTNESS_ALARM.value:
+            self._alarm = value == "1"
             return "alarm"
         return None
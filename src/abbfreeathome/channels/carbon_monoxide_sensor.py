@@ -49,13 +49,13 @@ class CarbonMonoxideSensor(Base):
         """Get the state of the sensor."""
         return self._state
 
-    def _refresh_state_from_datapoint(self, datapoint: dict[str, Any]) -> str:
+    def _refresh_state_from_datapoint(self, pairing_id: int, value: str) -> str:
         """
         Refresh the state of the channel from a given output.
 
         This will return the name of the attribute, which was refreshed or None.
         """
-        if datapoint.get("pairingID") == Pairing.AL_CO_ALARM_ACTIVE.value:
-            self._state = datapoint.get("value") == "1"
+        if pairing_id == Pairing.AL_CO_ALARM_ACTIVE.value:
+            self._state = value == "1"
             return "state"
         return None
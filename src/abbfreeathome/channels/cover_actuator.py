@@ -131,31 +131,26 @@ class CoverActuator(Base):
         await self._set_position_datapoint(str(value))
         self._position = value
 
-    def _refresh_state_from_datapoint(self, datapoint: dict[str, Any]) -> str:
+    def _refresh_state_from_datapoint(self, pairing_id: int, value: str) -> str:
         """
         Refresh the state of the channel from a given output.
 
         This will return whether the state was refreshed as a boolean value.
         """
-        if datapoint.get("pairingID") == Pairing.AL_INFO_MOVE_UP_DOWN.value:
+        if pairing_id == Pairing.AL_INFO_MOVE_UP_DOWN.value:
             try:
-                self._state = CoverActuatorState(datapoint.get("value"))
+                self._state = CoverActuatorState(value)
             except ValueError:
                 self._state = CoverActuatorState.unknown
             return "state"
-        if datapoint.get("pairingID") == Pairing.AL_INFO_FORCE.value:
+        if pairing_id == Pairing.AL_INFO_FORCE.value:
             try:
-                self._forced_position = CoverActuatorForcedPosition(
-                    datapoint.get("value")
-                )
+                self._forced_position = CoverActuatorForcedPosition(value)
             except ValueError:
                 self._forced_position = CoverActuatorForcedPosition.unknown
             return "forced_position"
-        if (
-            datapoint.get("pairingID")
-            == Pairing.AL_CURRENT_ABSOLUTE_POSITION_BLINDS_PERCENTAGE.value
-        ):
-            self._position = int(float(datapoint.get("value")))
+        if pairing_id == Pairing.AL_CURRENT_ABSOLUTE_POSITION_BLINDS_PERCENTAGE.value:
+            self._position = int(float(value))
             return "position"
         return None
 
@@ -284,19 +279,16 @@ class ShutterActuator(CoverActuator):
         await self._set_tilt_datapoint(str(value))
         self._tilt_position = value
 
-    def _refresh_state_from_datapoint(self, datapoint: dict[str, Any]) -> str:
+    def _refresh_state_from_datapoint(self, pairing_id: int, value: str) -> str:
         """
         Refresh the state of the channel from a given output.
 
         This will return the name of the attribute, which was refreshed or None.
         """
-        if (
-            datapoint.get("pairingID")
-            == Pairing.AL_CURRENT_ABSOLUTE_POSITION_SLATS_PERCENTAGE.value
-        ):
-            self._tilt_position = int(float(datapoint.get("value")))
+        if pairing_id == Pairing.AL_CURRENT_ABSOLUTE_POSITION_SLATS_PERCENTAGE.value:
+            self._tilt_position = int(float(value))
             return "tilt_position"
-        return super()._refresh_state_from_datapoint(datapoint)
+        return super()._refresh_state_from_datapoint(pairing_id, value)
 
     async def _set_tilt_datapoint(self, value: str):
         """Set the tilt position datapoint on the api."""
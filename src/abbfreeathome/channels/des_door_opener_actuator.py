@@ -59,14 +59,14 @@ class DesDoorOpenerActuator(Base):
         await self._set_switching_datapoint("1")
         self._state = True
 
-    def _refresh_state_from_datapoint(self, datapoint: dict[str, Any]) -> str:
+    def _refresh_state_from_datapoint(self, pairing_id: int, value: str) -> str:
         """
         Refresh the state of the channel from a given output.
 
         This will return the name of the attribute, which was refreshed or None.
         """
-        if datapoint.get("pairingID") == Pairing.AL_INFO_ON_OFF.value:
-            self._state = datapoint.get("value") == "1"
+        if pairing_id == Pairing.AL_INFO_ON_OFF.value:
+            self._state = value == "1"
             return "state"
         return None
 
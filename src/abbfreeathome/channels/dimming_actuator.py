@@ -117,23 +117,21 @@ class DimmingActuator(Base):
 
         self._forced_position = _position
 
-    def _refresh_state_from_datapoint(self, datapoint: dict[str, Any]) -> str:
+    def _refresh_state_from_datapoint(self, pairing_id: int, value: str) -> str:
         """
         Refresh the state of the channel from a given output.
 
         This will return whether the state was refreshed as a boolean value.
         """
-        if datapoint.get("pairingID") == Pairing.AL_INFO_ON_OFF.value:
-            self._state = datapoint.get("value") == "1"
+        if pairing_id == Pairing.AL_INFO_ON_OFF.value:
+            self._state = value == "1"
             return "state"
-        if datapoint.get("pairingID") == Pairing.AL_INFO_ACTUAL_DIMMING_VALUE.value:
-            self._brightness = int(float(datapoint.get("value")))
+        if pairing_id == Pairing.AL_INFO_ACTUAL_DIMMING_VALUE.value:
+            self._brightness = int(float(value))
             return "brightness"
-        if datapoint.get("pairingID") == Pairing.AL_INFO_FORCE.value:
+        if pairing_id == Pairing.AL_INFO_FORCE.value:
             try:
-                self._forced_position = DimmingActuatorForcedPosition(
-                    datapoint.get("value")
-                )
+                self._forced_position = DimmingActuatorForcedPosition(value)
             except ValueError:
                 self._forced_position = DimmingActuatorForcedPosition.unknown
             return "forced_position"
@@ -253,16 +251,16 @@ class ColorTemperatureActuator(DimmingActuator):
         await self._set_color_temperature_datapoint(str(value))
         self._color_temperature = value
 
-    def _refresh_state_from_datapoint(self, datapoint: dict[str, Any]) -> str:
+    def _refresh_state_from_datapoint(self, pairing_id: int, value: str) -> str:
         """
         Refresh the state of the channel from a given output.
 
         This will return the name of the attribute, which was refreshed or None.
         """
-        if datapoint.get("pairingID") == Pairing.AL_INFO_COLOR_TEMPERATURE.value:
-            self._color_temperature = int(float(datapoint.get("value")))
+        if pairing_id == Pairing.AL_INFO_COLOR_TEMPERATURE.value:
+            self._color_temperature = int(float(value))
             return "color_temperature"
-        return super()._refresh_state_from_datapoint(datapoint)
+        return super()._refresh_state_from_datapoint(pairing_id, value)
 
     async def _set_color_temperature_datapoint(self, value: str):
         """Set the color temperature on the api."""
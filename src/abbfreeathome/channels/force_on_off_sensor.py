@@ -58,13 +58,13 @@ class ForceOnOffSensor(Base):
         """Get the forceOnOff state."""
         return self._state.name
 
-    def _refresh_state_from_datapoint(self, datapoint: dict[str, Any]) -> str:
+    def _refresh_state_from_datapoint(self, pairing_id: int, value: str) -> str:
         """
         Refresh the state of the channel from a given output.
 
         This will return the name of the attribute, which was refreshed or None.
         """
-        if datapoint.get("pairingID") == Pairing.AL_FORCED.value:
+        if pairing_id == Pairing.AL_FORCED.value:
             """
             Forces value dependent high priority on or off state
 
@@ -75,9 +75,9 @@ class ForceOnOffSensor(Base):
             2 means on
             0 means off
             """
-            if datapoint.get("value") in ("2", "3"):
+            if value in ("2", "3"):
                 self._state = ForceOnOffSensorState.on
-            elif datapoint.get("value") in ("0", "1"):
+            elif value in ("0", "1"):
                 self._state = ForceOnOffSensorState.off
             else:
                 self._state = ForceOnOffSensorState.unknown
@@ -1,6 +1,6 @@
 """Free@Home HeatingActuator Class."""
 
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, ClassVar
 
 from ..bin.pairing import Pairing
 from .base import Base
@@ -8,16 +8,25 @@ from .base import Base
 if TYPE_CHECKING:
     from ..device import Device
 
+# Wire values for the 0-100 position range, precomputed so frequent position
+# updates skip a str() conversion per call.
+_POSITION_VALUES: tuple[str, ...] = tuple(str(_position) for _position in range(101))
+
 
 class HeatingActuator(Base):
     """Free@Home HeatingActuator Class."""
 
+    __slots__ = ("_position",)
+
     _state_refresh_pairings: list[Pairing] = [
         Pairing.AL_INFO_VALUE_HEATING,
     ]
     _callback_attributes: list[str] = [
         "position",
     ]
+    _refresh_handlers: ClassVar[dict[int, str]] = {
+        Pairing.AL_INFO_VALUE_HEATING.value: "_refresh_position",
+    }
 
     def __init__(
         self,
@@ -57,22 +66,33 @@ class HeatingActuator(Base):
         Fully closed = 0
         Fully open = 100
         """
-        value = max(0, value)
-        value = min(value, 100)
+        value = max(0, min(int(value), 100))
 
-        await self._set_position_datapoint(str(value))
+        await self._set_position_datapoint(_POSITION_VALUES[value])
         self._position = value
 
-    def _refresh_state_from_datapoint(self, datapoint: dict[str, Any]) -> str:
+    def _refresh_state_from_datapoint(self, pairing_id: int, value: str) -> str:
         """
         Refresh the state of the channel from a given output.
 
         This will return the name of the attribute, which was refreshed or None.
         """
-        if datapoint.get("pairingID") == Pairing.AL_INFO_VALUE_HEATING.value:
-            self._position = int(float(datapoint.get("value")))
-            return "position"
-        return None
+        _handler = self._refresh_handlers.get(pairing_id)
+        if _handler is None:
+            return None
+        return getattr(self, _handler)(value)
+
+    def _refresh_position(self, value: str) -> str:
+        """Refresh the position from a datapoint value."""
+        # Most feedback values are plain integers; only fall back to the
+        # float round-trip when the value carries a fractional part.
+        _position = int(value) if "." not in value else int(float(value))
+        # Frames often repeat the current value; skip the write and the
+        # downstream callbacks when nothing changed.
+        if _position == self._position:
+            return None
+        self._position = _position
+        return "position"
 
     async def _set_position_datapoint(self, value: str):
         """Set the position datapoint on the api."""
@@ -57,18 +57,18 @@ class MovementDetector(Base):
         """Get the brightness level of the sensor."""
         return self._brightness
 
-    def _refresh_state_from_datapoint(self, datapoint: dict[str, Any]) -> str:
+    def _refresh_state_from_datapoint(self, pairing_id: int, value: str) -> str:
         """
         Refresh the state of the channel from a given output.
 
         This will return the name of the attribute, which was refreshed or None.
         """
-        match datapoint.get("pairingID"):
+        match pairing_id:
             case Pairing.AL_TIMED_MOVEMENT.value:
-                self._state = datapoint.get("value") == "1"
+                self._state = value == "1"
                 return "state"
             case Pairing.AL_BRIGHTNESS_LEVEL.value:
-                self._brightness = float(datapoint.get("value"))
+                self._brightness = float(value)
                 return "brightness"
             case _:
                 return None
@@ -128,11 +128,11 @@ class BlockableMovementDetector(MovementDetector):
         await self._set_blocking_datapoint("0")
         self._blocked = False
 
-    def _refresh_state_from_datapoint(self, datapoint: dict[str, Any]) -> str:
-        if datapoint.get("pairingID") == Pairing.AL_INFO_LOCKED_SENSOR.value:
-            self._blocked = datapoint.get("value") == "1"
+    def _refresh_state_from_datapoint(self, pairing_id: int, value: str) -> str:
+        if pairing_id == Pairing.AL_INFO_LOCKED_SENSOR.value:
+            self._blocked = value == "1"
             return "blocked"
-        return super()._refresh_state_from_datapoint(datapoint)
+        return super()._refresh_state_from_datapoint(pairing_id, value)
 
     async def _set_blocking_datapoint(self, value: str):
         """Set the blocking datapoint on the api."""
@@ -128,19 +128,19 @@ class RoomTemperatureController(Base):
         await self._set_temperature_datapoint(str(value))
         self._target_temperature = value
 
-    def _refresh_state_from_datapoint(self, datapoint: dict[str, Any]) -> str:  # noqa: PLR0911
+    def _refresh_state_from_datapoint(self, pairing_id: int, value: str) -> str:  # noqa: PLR0911
         """
         Refresh the state of the channel from a given output.
 
         This will return the name of the attribute, which was refreshed or None.
         """
-        if datapoint.get("pairingID") == Pairing.AL_SET_POINT_TEMPERATURE.value:
-            self._target_temperature = float(datapoint.get("value"))
+        if pairing_id == Pairing.AL_SET_POINT_TEMPERATURE.value:
+            self._target_temperature = float(value)
             return "target_temperature"
-        if datapoint.get("pairingID") == Pairing.AL_CONTROLLER_ON_OFF.value:
-            self._state = datapoint.get("value") == "1"
+        if pairing_id == Pairing.AL_CONTROLLER_ON_OFF.value:
+            self._state = value == "1"
             return "state"
-        if datapoint.get("pairingID") == Pairing.AL_STATE_INDICATION.value:
+        if pairing_id == Pairing.AL_STATE_INDICATION.value:
             """
             This returns a integer bitwise-ORed with the following masks:
             0x01 - comfort mode                 (65)
@@ -154,21 +154,21 @@ class RoomTemperatureController(Base):
 
             At the moment only 0x04 (eco mode) is needed
             """
-            self._state_indication = int(datapoint.get("value"))
-            self._eco_mode = int(datapoint.get("value")) & 0x04 == 0x04
+            self._state_indication = int(value)
+            self._eco_mode = int(value) & 0x04 == 0x04
             return "eco_mode"
-        if datapoint.get("pairingID") == Pairing.AL_MEASURED_TEMPERATURE.value:
-            self._current_temperature = float(datapoint.get("value"))
+        if pairing_id == Pairing.AL_MEASURED_TEMPERATURE.value:
+            self._current_temperature = float(value)
             return "current_temperature"
-        if datapoint.get("pairingID") == Pairing.AL_ACTUATING_VALUE_HEATING.value:
+        if pairing_id == Pairing.AL_ACTUATING_VALUE_HEATING.value:
             try:
-                self._heating = int(float(datapoint.get("value")))
+                self._heating = int(float(value))
             except ValueError:
                 self._heating = 0
             return "heating"
-        if datapoint.get("pairingID") == Pairing.AL_ACTUATING_VALUE_COOLING.value:
+        if pairing_id == Pairing.AL_ACTUATING_VALUE_COOLING.value:
             try:
-                self._cooling = int(float(datapoint.get("value")))
+                self._cooling = int(float(value))
             except ValueError:
                 self._cooling = 0
             return "cooling"
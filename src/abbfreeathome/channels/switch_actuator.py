@@ -69,14 +69,14 @@ class SimpleSwitchActuator(Base):
         await self._set_switching_datapoint("0")
         self._state = False
 
-    def _refresh_state_from_datapoint(self, datapoint: dict[str, Any]) -> str:
+    def _refresh_state_from_datapoint(self, pairing_id: int, value: str) -> str:
         """
         Refresh the state of the channel from a given output.
 
         This will return the name of the attribute, which was refreshed or None.
         """
-        if datapoint.get("pairingID") == Pairing.AL_INFO_ON_OFF.value:
-            self._state = datapoint.get("value") == "1"
+        if pairing_id == Pairing.AL_INFO_ON_OFF.value:
+            self._state = value == "1"
             return "state"
         return None
 
@@ -153,21 +153,19 @@ class SwitchActuator(SimpleSwitchActuator):
 
         self._forced_position = _position
 
-    def _refresh_state_from_datapoint(self, datapoint: dict[str, Any]) -> str:
+    def _refresh_state_from_datapoint(self, pairing_id: int, value: str) -> str:
         """
         Refresh the state of the channel from a given output.
 
         This will return the name of the attribute, which was refreshed or None.
         """
-        _return_value = super()._refresh_state_from_datapoint(datapoint)
+        _return_value = super()._refresh_state_from_datapoint(pairing_id, value)
         if _return_value is not None:
             return _return_value
 
-        if datapoint.get("pairingID") == Pairing.AL_INFO_FORCE.value:
+        if pairing_id == Pairing.AL_INFO_FORCE.value:
             try:
-                self._forced_position = SwitchActuatorForcedPosition(
-                    datapoint.get("value")
-                )
+                self._forced_position = SwitchActuatorForcedPosition(value)
             except ValueError:
                 self._forced_position = SwitchActuatorForcedPosition.unknown
             return "forced_position"
@@ -96,27 +96,27 @@ class SwitchSensor(Base):
         await self._set_led_datapoint("0")
         self._led = False
 
-    def _refresh_state_from_datapoint(self, datapoint: dict[str, Any]) -> str:
+    def _refresh_state_from_datapoint(self, pairing_id: int, value: str) -> str:
         """
         Refresh the state of the channel from a given output.
 
         This will return whether the state was refreshed as a boolean value.
         """
-        if datapoint.get("pairingID") == Pairing.AL_SWITCH_ON_OFF.value:
+        if pairing_id == Pairing.AL_SWITCH_ON_OFF.value:
             try:
-                self._switch_sensor_state = SwitchSensorState(datapoint.get("value"))
+                self._switch_sensor_state = SwitchSensorState(value)
             except ValueError:
                 self._switch_sensor_state = SwitchSensorState.unknown
 
             self._state = self._switch_sensor_state
             return "state"
-        if datapoint.get("pairingID") == Pairing.AL_INFO_ON_OFF.value:
+        if pairing_id == Pairing.AL_INFO_ON_OFF.value:
             try:
                 _, _parameter_value = self.get_channel_parameter(
                     parameter=Parameter.PID_LED_OPERATION_MODE
                 )
                 if _parameter_value == "2":
-                    self._led = datapoint.get("value") == "1"
+                    self._led = value == "1"
                     return "led"
             except InvalidDeviceChannelParameter:
                 return None
@@ -141,9 +141,10 @@ class SwitchSensor(Base):
         _io_key = datapoint_key.split("/")[-1]
 
         if _io_key in self._inputs:
-            self._inputs[_io_key]["value"] = datapoint_value
+            _input = self._inputs[_io_key]
+            _input["value"] = datapoint_value
             _callback_attribute = self._refresh_state_from_datapoint(
-                datapoint=self._inputs[_io_key]
+                _input.get("pairingID"), datapoint_value
             )
 
         if _callback_attribute and self._callbacks[_callback_attribute]:
@@ -167,19 +168,16 @@ class SwitchSensor(Base):
                 )
             )[0]
 
-            self._refresh_state_from_datapoint(
-                datapoint={
-                    "pairingID": _pairing.value,
-                    "value": _datapoint,
-                }
-            )
+            self._refresh_state_from_datapoint(_pairing.value, _datapoint)
 
     def _refresh_state_from_datapoints(self):
         """Refresh the state of the channel from the datapoints."""
         super()._refresh_state_from_datapoints()
 
         for _datapoint in self._inputs.values():
-            self._refresh_state_from_datapoint(_datapoint)
+            self._refresh_state_from_datapoint(
+                _datapoint.get("pairingID"), _datapoint.get("value")
+            )
 
 
 class DimmingSensor(SwitchSensor):
@@ -221,19 +219,19 @@ class DimmingSensor(SwitchSensor):
         """Get the dimming state."""
         return self._dimming_sensor_state.name
 
-    def _refresh_state_from_datapoint(self, datapoint: dict[str, Any]) -> str:
+    def _refresh_state_from_datapoint(self, pairing_id: int, value: str) -> str:
         """
         Refresh the state of the channel from a given output.
 
         This will return the name of the attribute, which was refreshed or None.
         """
-        _return_value = super()._refresh_state_from_datapoint(datapoint)
+        _return_value = super()._refresh_state_from_datapoint(pairing_id, value)
         if _return_value is not None:
             return _return_value
 
-        if datapoint.get("pairingID") == Pairing.AL_RELATIVE_SET_VALUE_CONTROL.value:
+        if pairing_id == Pairing.AL_RELATIVE_SET_VALUE_CONTROL.value:
             try:
-                self._dimming_sensor_state = DimmingSensorState(datapoint.get("value"))
+                self._dimming_sensor_state = DimmingSensorState(value)
             except ValueError:
                 self._dimming_sensor_state = DimmingSensorState.unknown
 
@@ -1,6 +1,7 @@
 """Free@Home TemperatureSensor Class."""
 
-from typing import TYPE_CHECKING, Any
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, ClassVar
 
 from ..bin.pairing import Pairing
 from .base import Base
@@ -8,10 +9,16 @@ from .base import Base
 if TYPE_CHECKING:
     from ..device import Device
 
+# Sensor readings tend to repeat for many consecutive frames until the
+# measurement changes, so cache the string-to-float conversion.
+_parse_float = lru_cache(maxsize=64)(float)
+
 
 class TemperatureSensor(Base):
     """Free@Home TemperatureSensor Class."""
 
+    __slots__ = ("_state", "_alarm")
+
     _state_refresh_pairings: list[Pairing] = [
         Pairing.AL_OUTDOOR_TEMPERATURE,
         Pairing.AL_FROST_ALARM,
@@ -20,6 +27,10 @@ class TemperatureSensor(Base):
         "state",
         "alarm",
     ]
+    _refresh_handlers: ClassVar[dict[int, str]] = {
+        Pairing.AL_OUTDOOR_TEMPERATURE.value: "_refresh_temperature",
+        Pairing.AL_FROST_ALARM.value: "_refresh_alarm",
+    }
 
     def __init__(
         self,
@@ -57,16 +68,31 @@ class TemperatureSensor(Base):
         """Get the alarm state of the sensor."""
         return self._alarm
 
-    def _refresh_state_from_datapoint(self, datapoint: dict[str, Any]) -> bool:
+    def _refresh_state_from_datapoint(self, pairing_id: int, value: str) -> bool:
         """
         Refresh the state of the channel from a given output.
 
         This will return the name of the attribute, which was refreshed or None.
         """
-        if datapoint.get("pairingID") == Pairing.AL_OUTDOOR_TEMPERATURE.value:
-            self._state = float(datapoint.get("value"))
-            return "state"
-        if datapoint.get("pairingID") == Pairing.AL_FROST_ALARM.value:
-            self._alarm = datapoint.get("value") == "1"
-            return "alarm"
-        return None
+        _handler = self._refresh_handlers.get(pairing_id)
+        if _handler is None:
+            return None
+        return getattr(self, _handler)(value)
+
+    def _refresh_temperature(self, value: str) -> str:
+        """Refresh the temperature state from a datapoint value."""
+        _state = _parse_float(value)
+        # Frames often repeat the current value; skip the write and the
+        # downstream callbacks when nothing changed.
+        if _state == self._state:
+            return None
+        self._state = _state
+        return "state"
+
+    def _refresh_alarm(self, value: str) -> str:
+        """Refresh the alarm state from a datapoint value."""
+        _alarm = value == "1"
+        if _alarm == self._alarm:
+            return None
+        self._alarm = _alarm
+        return "alarm"
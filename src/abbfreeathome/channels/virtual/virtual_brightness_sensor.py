@@ -78,20 +78,20 @@ class VirtualBrightnessSensor(Base):
         await self._set_alarm_datapoint("0")
         self._alarm = False
 
-    def _refresh_state_from_datapoint(self, datapoint: dict[str, Any]) -> str:
+    def _refresh_state_from_datapoint(self, pairing_id: int, value: str) -> str:
         """
         Refresh the state of the channel from a given output.
 
         This will return the name of the attribute, which was refreshed or None.
         """
-        if datapoint.get("pairingID") == Pairing.AL_BRIGHTNESS_LEVEL.value:
+        if pairing_id == Pairing.AL_BRIGHTNESS_LEVEL.value:
             try:
-                self._brightness = int(float(datapoint.get("value")))
+                self._brightness = int(float(value))
             except ValueError:
                 self._brightness = 0
             return "brightness"
-        if datapoint.get("pairingID") == Pairing.AL_BRIGHTNESS_ALARM.value:
-            self._alarm = datapoint.get("value") == "1"
+        if pairing_id == Pairing.AL_BRIGHTNESS_ALARM.value:
+            self._alarm = value == "1"
             return "alarm"
 
         return None
@@ -126,54 +126,39 @@ class VirtualEnergyTwoWayMeter(Base):
         await self._set_exported_total_datapoint(str(value))
         self._exported_total = value
 
-    def _refresh_state_from_datapoint(self, datapoint: dict[str, Any]) -> str:
+    def _refresh_state_from_datapoint(self, pairing_id: int, value: str) -> str:
         """
         Refresh the state of the channel from a given output.
 
         This will return the name of the attribute, which was refreshed or None.
         """
-        if (
-            datapoint.get("pairingID")
-            == Pairing.AL_MEASURED_CURRENT_POWER_CONSUMED.value
-        ):
+        if pairing_id == Pairing.AL_MEASURED_CURRENT_POWER_CONSUMED.value:
             try:
-                self._current_power = float(datapoint.get("value"))
+                self._current_power = float(value)
             except ValueError:
                 self._current_power = 0.0
             return "current_power"
-        if (
-            datapoint.get("pairingID")
-            == Pairing.AL_MEASURED_IMPORTED_ENERGY_TODAY.value
-        ):
+        if pairing_id == Pairing.AL_MEASURED_IMPORTED_ENERGY_TODAY.value:
             try:
-                self._imported_today = int(datapoint.get("value"))
+                self._imported_today = int(value)
             except ValueError:
                 self._imported_today = 0
             return "imported_today"
-        if (
-            datapoint.get("pairingID")
-            == Pairing.AL_MEASURED_EXPORTED_ENERGY_TODAY.value
-        ):
+        if pairing_id == Pairing.AL_MEASURED_EXPORTED_ENERGY_TODAY.value:
             try:
-                self._exported_today = int(datapoint.get("value"))
+                self._exported_today = int(value)
             except ValueError:
                 self._exported_today = 0
             return "exported_today"
-        if (
-            datapoint.get("pairingID")
-            == Pairing.AL_MEASURED_TOTAL_ENERGY_IMPORTED.value
-        ):
+        if pairing_id == Pairing.AL_MEASURED_TOTAL_ENERGY_IMPORTED.value:
             try:
-                self._imported_total = int(datapoint.get("value"))
+                self._imported_total = int(value)
             except ValueError:
                 self._imported_total = 0
             return "imported_total"
-        if (
-            datapoint.get("pairingID")
-            == Pairing.AL_MEASURED_TOTAL_ENERGY_EXPORTED.value
-        ):
+        if pairing_id == Pairing.AL_MEASURED_TOTAL_ENERGY_EXPORTED.value:
             try:
-                self._exported_total = int(datapoint.get("value"))
+                self._exported_total = int(value)
             except ValueError:
                 self._exported_total = 0
             return "exported_total"
@@ -142,35 +142,32 @@ class VirtualRoomTemperatureController(Base):
         await self._set_current_temperature_datapoint(str(value))
         self._current_temperature = value
 
-    def _refresh_state_from_datapoint(self, datapoint: dict[str, Any]) -> str:  # noqa: PLR0911
+    def _refresh_state_from_datapoint(self, pairing_id: int, value: str) -> str:  # noqa: PLR0911
         """
         Refresh the state of the channel from a given output.
 
         This will return the name of the attribute, which was refreshed or None.
         """
-        if datapoint.get("pairingID") == Pairing.AL_ECO_ON_OFF.value:
-            self._requested_eco_mode = datapoint.get("value") == "1"
+        if pairing_id == Pairing.AL_ECO_ON_OFF.value:
+            self._requested_eco_mode = value == "1"
             return "requested_eco_mode"
-        if datapoint.get("pairingID") == Pairing.AL_STATE_INDICATION.value:
-            self._eco_mode = int(datapoint.get("value")) & 0x04 == 0x04
+        if pairing_id == Pairing.AL_STATE_INDICATION.value:
+            self._eco_mode = int(value) & 0x04 == 0x04
             return "eco_mode"
-        if datapoint.get("pairingID") == Pairing.AL_CONTROLLER_ON_OFF_REQUEST.value:
-            self._requested_state = datapoint.get("value") == "1"
+        if pairing_id == Pairing.AL_CONTROLLER_ON_OFF_REQUEST.value:
+            self._requested_state = value == "1"
             return "requested_state"
-        if datapoint.get("pairingID") == Pairing.AL_CONTROLLER_ON_OFF.value:
-            self._state = datapoint.get("value") == "1"
+        if pairing_id == Pairing.AL_CONTROLLER_ON_OFF.value:
+            self._state = value == "1"
             return "state"
-        if (
-            datapoint.get("pairingID")
-            == Pairing.AL_INFO_ABSOLUTE_SET_POINT_REQUEST.value
-        ):
-            self._requested_target_temperature = float(datapoint.get("value"))
+        if pairing_id == Pairing.AL_INFO_ABSOLUTE_SET_POINT_REQUEST.value:
+            self._requested_target_temperature = float(value)
             return "requested_target_temperature"
-        if datapoint.get("pairingID") == Pairing.AL_SET_POINT_TEMPERATURE.value:
-            self._target_temperature = float(datapoint.get("value"))
+        if pairing_id == Pairing.AL_SET_POINT_TEMPERATURE.value:
+            self._target_temperature = float(value)
             return "target_temperature"
-        if datapoint.get("pairingID") == Pairing.AL_MEASURED_TEMPERATURE.value:
-            self._current_temperature = float(datapoint.get("value"))
+        if pairing_id == Pairing.AL_MEASURED_TEMPERATURE.value:
+            self._current_temperature = float(value)
             return "current_temperature"
         return None
 
@@ -235,15 +232,17 @@ class VirtualRoomTemperatureController(Base):
         _io_key = datapoint_key.split("/")[-1]
 
         if _io_key in self._outputs:
-            self._outputs[_io_key]["value"] = datapoint_value
+            _output = self._outputs[_io_key]
+            _output["value"] = datapoint_value
             _callback_attribute = self._refresh_state_from_datapoint(
-                datapoint=self._outputs[_io_key]
+                _output.get("pairingID"), datapoint_value
             )
 
         if _io_key in self._inputs:
-            self._inputs[_io_key]["value"] = datapoint_value
+            _input = self._inputs[_io_key]
+            _input["value"] = datapoint_value
             _callback_attribute = self._refresh_state_from_datapoint(
-                datapoint=self._inputs[_io_key]
+                _input.get("pairingID"), datapoint_value
             )
 
         if _callback_attribute and self._callbacks[_callback_attribute]:
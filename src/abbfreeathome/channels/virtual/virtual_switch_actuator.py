@@ -74,17 +74,17 @@ class VirtualSwitchActuator(Base):
         await self._set_switching_datapoint("0")
         self._state = False
 
-    def _refresh_state_from_datapoint(self, datapoint: dict[str, Any]) -> str:
+    def _refresh_state_from_datapoint(self, pairing_id: int, value: str) -> str:
         """
         Refresh the state of the channel from a given output.
 
         This will return the name of the attribute, which was refreshed or None.
         """
-        if datapoint.get("pairingID") == Pairing.AL_SWITCH_ON_OFF.value:
-            self._requested_state = datapoint.get("value") == "1"
+        if pairing_id == Pairing.AL_SWITCH_ON_OFF.value:
+            self._requested_state = value == "1"
             return "requested_state"
-        if datapoint.get("pairingID") == Pairing.AL_INFO_ON_OFF.value:
-            self._state = datapoint.get("value") == "1"
+        if pairing_id == Pairing.AL_INFO_ON_OFF.value:
+            self._state = value == "1"
             return "state"
         return None
 
@@ -112,15 +112,17 @@ class VirtualSwitchActuator(Base):
         _io_key = datapoint_key.split("/")[-1]
 
         if _io_key in self._outputs:
-            self._outputs[_io_key]["value"] = datapoint_value
+            _output = self._outputs[_io_key]
+            _output["value"] = datapoint_value
             _callback_attribute = self._refresh_state_from_datapoint(
-                datapoint=self._outputs[_io_key]
+                _output.get("pairingID"), datapoint_value
             )
 
         if _io_key in self._inputs:
-            self._inputs[_io_key]["value"] = datapoint_value
+            _input = self._inputs[_io_key]
+            _input["value"] = datapoint_value
             _callback_attribute = self._refresh_state_from_datapoint(
-                datapoint=self._inputs[_io_key]
+                _input.get("pairingID"), datapoint_value
             )
 
         if _callback_attribute and self._callbacks[_callback_attribute]:
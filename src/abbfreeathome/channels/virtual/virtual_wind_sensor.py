@@ -99,24 +99,24 @@ class VirtualWindSensor(Base):
         await self._set_force_datapoint(str(value))
         self._force = value
 
-    def _refresh_state_from_datapoint(self, datapoint: dict[str, Any]) -> str:
+    def _refresh_state_from_datapoint(self, pairing_id: int, value: str) -> str:
         """
         Refresh the state of the channel from a given output.
 
         This will return the name of the attribute, which was refreshed or None.
         """
-        if datapoint.get("pairingID") == Pairing.AL_WIND_SPEED.value:
+        if pairing_id == Pairing.AL_WIND_SPEED.value:
             try:
-                self._speed = float(datapoint.get("value"))
+                self._speed = float(value)
             except ValueError:
                 self._speed = 0.0
             return "speed"
-        if datapoint.get("pairingID") == Pairing.AL_WIND_ALARM.value:
-            self._alarm = datapoint.get("value") == "1"
+        if pairing_id == Pairing.AL_WIND_ALARM.value:
+            self._alarm = value == "1"
             return "alarm"
-        if datapoint.get("pairingID") == Pairing.AL_WIND_FORCE.value:
+        if pairing_id == Pairing.AL_WIND_FORCE.value:
             try:
-                self._force = int(datapoint.get("value"))
+                self._force = int(value)
             except ValueError:
                 self._force = 0
             return "force"
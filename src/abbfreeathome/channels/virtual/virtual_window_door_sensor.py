@@ -59,14 +59,14 @@ class VirtualWindowDoorSensor(Base):
         await self._set_switching_datapoint("0")
         self._state = False
 
-    def _refresh_state_from_datapoint(self, datapoint: dict[str, Any]) -> str:
+    def _refresh_state_from_datapoint(self, pairing_id: int, value: str) -> str:
         """
         Refresh the state of the channel from a given output.
 
         This will return the name of the attribute, which was refreshed or None.
         """
-        if datapoint.get("pairingID") == Pairing.AL_WINDOW_DOOR.value:
-            self._state = datapoint.get("value") == "1"
+        if pairing_id == Pairing.AL_WINDOW_DOOR.value:
+            self._state = value == "1"
             return "state"
 
         return None
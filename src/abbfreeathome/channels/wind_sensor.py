@@ -65,19 +65,19 @@ class WindSensor(Base):
         """Get the force state of the sensor."""
         return self._force
 
-    def _refresh_state_from_datapoint(self, datapoint: dict[str, Any]) -> str:
+    def _refresh_state_from_datapoint(self, pairing_id: int, value: str) -> str:
         """
         Refresh the state of the channel from a given output.
 
         This will return the name of the attribute, which was refreshed or None.
         """
-        if datapoint.get("pairingID") == Pairing.AL_WIND_SPEED.value:
-            self._state = float(datapoint.get("value"))
+        if pairing_id == Pairing.AL_WIND_SPEED.value:
+            self._state = float(value)
             return "state"
-        if datapoint.get("pairingID") == Pairing.AL_WIND_ALARM.value:
-            self._alarm = datapoint.get("value") == "1"
+        if pairing_id == Pairing.AL_WIND_ALARM.value:
+            self._alarm = value == "1"
             return "alarm"
-        if datapoint.get("pairingID") == Pairing.AL_WIND_FORCE.value:
-            self._force = int(datapoint.get("value"))
+        if pairing_id == Pairing.AL_WIND_FORCE.value:
+            self._force = int(value)
             return "force"
         return None
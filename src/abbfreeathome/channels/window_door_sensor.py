@@ -70,18 +70,18 @@ class WindowDoorSensor(Base):
         """Get the sensor position."""
         return self._position.name
 
-    def _refresh_state_from_datapoint(self, datapoint: dict[str, Any]) -> str:
+    def _refresh_state_from_datapoint(self, pairing_id: int, value: str) -> str:
         """
         Refresh the state of the channel from a given output.
 
         This will return the name of the attribute, which was refreshed or None.
         """
-        if datapoint.get("pairingID") == Pairing.AL_WINDOW_DOOR.value:
-            self._state = datapoint.get("value") == "1"
+        if pairing_id == Pairing.AL_WINDOW_DOOR.value:
+            self._state = value == "1"
             return "state"
-        if datapoint.get("pairingID") == Pairing.AL_WINDOW_DOOR_POSITION.value:
+        if pairing_id == Pairing.AL_WINDOW_DOOR_POSITION.value:
             try:
-                self._position = WindowDoorSensorPosition(datapoint.get("value"))
+                self._position = WindowDoorSensorPosition(value)
             except ValueError:
                 self._position = WindowDoorSensorPosition.unknown
             return "position"
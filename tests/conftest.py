@@ -1,9 +1,41 @@
 """Shared test fixtures for the ABB-Free@Home test suite."""
 
+import asyncio
+from unittest.mock import AsyncMock
+
 import pytest
 
 from src.abbfreeathome.floorplan import Floorplan
 
+try:
+    import uvloop
+except ImportError:  # pragma: no cover - uvloop is optional (e.g. on Windows)
+    uvloop = None
+
+
+def pytest_configure(config):
+    """Run the suite on uvloop-backed loops when available."""
+    # Installing the policy globally avoids overriding pytest-asyncio's
+    # deprecated event_loop_policy fixture; its default picks this up.
+    if uvloop is not None:
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+
+
+class FakeApi:
+    """
+    Lightweight stand-in for FreeAtHomeApi in channel tests.
+
+    Only the api methods the channels call are provided, as plain
+    AsyncMocks; spec'ing the whole FreeAtHomeApi class would introspect
+    every attribute on each fixture construction.
+    """
+
+    def __init__(self):
+        """Initialize the FakeApi class."""
+        self.get_datapoint = AsyncMock()
+        self.set_datapoint = AsyncMock()
+        self.virtualdevice = AsyncMock()
+
 
 @pytest.fixture
 def mock_floorplan():
@@ -1,6 +1,7 @@
 """Test code to test all FreeAtHome class."""
 
-from unittest.mock import AsyncMock, Mock, PropertyMock, patch
+import asyncio
+from unittest.mock import AsyncMock, Mock, patch
 
 import aiohttp
 import aiohttp.client_exceptions
@@ -9,7 +10,7 @@ import pytest
 import pytest_asyncio
 import voluptuous as vol
 
-from src.abbfreeathome.api import FreeAtHomeApi, FreeAtHomeSettings
+from src.abbfreeathome.api import FreeAtHomeApi, FreeAtHomeSettings, _build_ssl_context
 from src.abbfreeathome.exceptions import (
     BadRequestException,
     ClientConnectionError,
@@ -23,10 +24,118 @@ from src.abbfreeathome.exceptions import (
     UserNotFoundException,
 )
 
+# Sentinel mocks for exception constructors that only need placeholder
+# arguments; the tests never inspect them, so one shared instance is enough.
+_CONNECTION_KEY = Mock()
+_SSL_ERROR = Mock()
+
+
+def _ws_message(message_type, payload=None):
+    """Build a mocked websocket message of the given type."""
+    if payload is None:
+        return Mock(type=message_type)
+    return Mock(type=message_type, json=Mock(return_value=payload))
+
+
+def _connected_ws_response(message):
+    """Build a mocked, connected websocket response yielding the message."""
+    return Mock(
+        closed=False,
+        receive=AsyncMock(return_value=message),
+        close=AsyncMock(),
+    )
+
+
+@pytest_asyncio.fixture(scope="module")
+async def client_session():
+    """
+    Create a single aiohttp ClientSession shared across the module.
+
+    Creating (and closing) a ClientSession per test is by far the most
+    expensive part of these fixtures; the session itself is either mocked or
+    unused, so one shared instance is safe to reuse.
+    """
+    session = aiohttp.ClientSession()
+    yield session
+    await session.close()
+
+
+@pytest_asyncio.fixture
+async def api(client_session):
+    """Create FreeAtHome Api Fixture."""
+    instance = FreeAtHomeApi(
+        host="http://192.168.1.1",
+        username="user",
+        password="pass",
+        client_session=client_session,
+    )
+    yield instance
+    # Cleanup: Close any client session that might have been created by a test
+    await instance.close_client_session()
+
 
 @pytest_asyncio.fixture
-async def api():
+async def settings(client_session):
     """Create FreeAtHome Api Fixture."""
+    instance = FreeAtHomeSettings(
+        host="http://192.168.1.1", client_session=client_session
+    )
+    yield instance
+    # Cleanup: Close any client session that might have been created by a test
+    await instance.close_client_session()
+
+
+@pytest.fixture(scope="module")
+def mock_aioresponse():
+    """
+    Mock aiohttp requests with a single module-wide aioresponses patch.
+
+    Entering/exiting aioresponses per test re-patches ClientSession._request
+    every time; one shared instance avoids that. The passthrough prefix only
+    matches the scheme-less urls built by the invalid-host tests, which must
+    reach the real request plumbing to raise InvalidUrlClientError.
+    """
+    with aioresponses(passthrough=["192.168.1.1"]) as mocked:
+        yield mocked
+
+
+@pytest.fixture(autouse=True)
+def mock_sleep(monkeypatch):
+    """
+    Replace asyncio.sleep with a recording no-op for every test.
+
+    This avoids re-patching asyncio.sleep in each websocket test and
+    guarantees no test accidentally waits out a real retry interval.
+    """
+    sleep = AsyncMock()
+    monkeypatch.setattr(asyncio, "sleep", sleep)
+    return sleep
+
+
+@pytest.fixture(autouse=True)
+def _reset_mock_aioresponse(mock_aioresponse):
+    """Clear registered responses and recorded requests between tests."""
+    yield
+    mock_aioresponse._responses.clear()
+    mock_aioresponse.requests.clear()
+
+
+@pytest.fixture
+def mock_request(api, monkeypatch):
+    """
+    Stub api._request with an AsyncMock the tests can configure.
+
+    Saves each test from installing and removing its own patch.object
+    context manager around _request.
+    """
+    request = AsyncMock(return_value=Mock())
+    monkeypatch.setattr(api, "_request", request)
+    return request
+
+
+@pytest_asyncio.fixture
+async def fresh_api():
+    """Create FreeAtHome Api Fixture with its own client session."""
     instance = FreeAtHomeApi(
         host="http://192.168.1.1", username="user", password="pass"
     )
@@ -36,25 +145,23 @@ async def api():
 
 
 @pytest_asyncio.fixture
-async def settings():
-    """Create FreeAtHome Api Fixture."""
+async def fresh_settings():
+    """Create FreeAtHome Settings Fixture with its own client session."""
     instance = FreeAtHomeSettings(host="http://192.168.1.1")
     yield instance
     # Cleanup: Close any client session that might have been created
     await instance.close_client_session()
 
 
-@pytest.mark.asyncio
 async def test_settings_aenter_returns_instance(settings):
     """Test the __aenter__ function with own session."""
     async with settings as instance:
         assert instance is settings
 
 
-@pytest.mark.asyncio
 async def test_settings_aexit_closes_client_session(settings):
     """Test the __aexit__ function with own session."""
-    mock_session = AsyncMock(spec=aiohttp.ClientSession)
+    mock_session = AsyncMock()
 
     settings._client_session = mock_session
     settings._close_client_session = True  # Ensure the session should close
@@ -66,25 +173,11 @@ async def test_settings_aexit_closes_client_session(settings):
     settings._client_session.close.assert_awaited_once()
 
 
-@pytest.mark.asyncio
-async def test_load_success(settings):
+async def test_load_success(settings, mock_aioresponse):
     """Test loading settings into class."""
-    with aioresponses() as m:
-        m.get(
-            "http://192.168.1.1/settings.json",
-            payload={
-                "users": [{"name": "test_user"}],
-                "flags": {
-                    "version": "1.0",
-                    "serialNumber": "12345",
-                    "name": "SysAP",
-                    "hardwareVersion": "54321",
-                },
-            },
-        )
-
-        await settings.load()
-        assert settings._settings == {
+    mock_aioresponse.get(
+        "http://192.168.1.1/settings.json",
+        payload={
             "users": [{"name": "test_user"}],
             "flags": {
                 "version": "1.0",
@@ -92,10 +185,21 @@ async def test_load_success(settings):
                 "name": "SysAP",
                 "hardwareVersion": "54321",
             },
-        }
+        },
+    )
+
+    await settings.load()
+    assert settings._settings == {
+        "users": [{"name": "test_user"}],
+        "flags": {
+            "version": "1.0",
+            "serialNumber": "12345",
+            "name": "SysAP",
+            "hardwareVersion": "54321",
+        },
+    }
 
 
-@pytest.mark.asyncio
 async def test_settings_load_invalid_url(settings):
     """Test the setting load with an invalid url."""
     with patch.object(settings, "_get_client_session") as mock_get_session:
@@ -106,64 +210,37 @@ async def test_settings_load_invalid_url(settings):
             await settings.load()
 
 
-@pytest.mark.asyncio
-async def test_get_settings_invalid_host(settings):
+async def test_get_settings_invalid_host(fresh_settings):
     """Test the get_settings function for invalid host."""
-    settings._host = "192.168.1.1"
+    fresh_settings._host = "192.168.1.1"
 
     with pytest.raises(InvalidHostException):
-        await settings.load()
+        await fresh_settings.load()
 
 
-@pytest.mark.asyncio
 async def test_get_settings_client_connection_error(settings):
-    """Test the _request function for an invalid client."""
-    settings._host = "http://0.0.0.0:1"
-
-    try:
-        with pytest.raises(ClientConnectionError):
-            await settings.load()
-    finally:
-        # Cleanup any client session that might have been created during failed request
-        await settings.close_client_session()
-
-
-@pytest.mark.asyncio
-async def test_get_settings_ssl_certificate_error(settings):
-    """Test the load function for SSL certificate error."""
+    """Test the load function for a client connection error."""
     with patch.object(settings, "_get_client_session") as mock_get_session:
-        connection_key = Mock()
-        ssl_error = Mock()
         mock_get_session.return_value.get.side_effect = (
-            aiohttp.client_exceptions.ClientConnectorCertificateError(
-                connection_key, ssl_error
-            )
+            aiohttp.client_exceptions.ClientConnectionError("boom")
         )
-        with pytest.raises(SslErrorException):
-            await settings.load()
-
-
-@pytest.mark.asyncio
-async def test_get_settings_ssl_connector_error(settings):
-    """Test the load function for SSL connector error."""
-    with patch.object(settings, "_get_client_session") as mock_get_session:
-        connection_key = Mock()
-        ssl_error = Mock()
-        mock_get_session.return_value.get.side_effect = (
-            aiohttp.client_exceptions.ClientConnectorSSLError(connection_key, ssl_error)
-        )
-        with pytest.raises(SslErrorException):
+        with pytest.raises(ClientConnectionError):
             await settings.load()
 
 
-@pytest.mark.asyncio
-async def test_get_settings_client_ssl_error(settings):
-    """Test the load function for client SSL error."""
+@pytest.mark.parametrize(
+    "exception_class",
+    [
+        aiohttp.client_exceptions.ClientConnectorCertificateError,
+        aiohttp.client_exceptions.ClientConnectorSSLError,
+        aiohttp.client_exceptions.ClientSSLError,
+    ],
+)
+async def test_get_settings_ssl_errors(settings, exception_class):
+    """Test the load function for the different SSL errors."""
     with patch.object(settings, "_get_client_session") as mock_get_session:
-        connection_key = Mock()
-        ssl_error = Mock()
-        mock_get_session.return_value.get.side_effect = (
-            aiohttp.client_exceptions.ClientSSLError(connection_key, ssl_error)
+        mock_get_session.return_value.get.side_effect = exception_class(
+            _CONNECTION_KEY, _SSL_ERROR
         )
         with pytest.raises(SslErrorException):
             await settings.load()
@@ -221,17 +298,15 @@ def test_name_property(settings):
     assert settings.name == "SysAP"
 
 
-@pytest.mark.asyncio
 async def test_aenter_returns_instance(api):
     """Test the __aenter__ function with own session."""
     async with api as instance:
         assert instance is api
 
 
-@pytest.mark.asyncio
 async def test_aexit_closes_client_session_and_websocket(api):
     """Test the __aexit__ function with own session."""
-    mock_session = AsyncMock(spec=aiohttp.ClientSession)
+    mock_session = AsyncMock()
 
     api._client_session = mock_session
     api._ws_response = AsyncMock()
@@ -248,10 +323,9 @@ async def test_aexit_closes_client_session_and_websocket(api):
     api._client_session.close.assert_awaited_once()
 
 
-@pytest.mark.asyncio
 async def test_aexit_does_not_close_client_session_when_not_needed(api):
     """Test the __aexit__ function with external session."""
-    mock_session = AsyncMock(spec=aiohttp.ClientSession)
+    mock_session = AsyncMock()
 
     api._client_session = mock_session
     api._ws_response = AsyncMock()
@@ -268,147 +342,118 @@ async def test_aexit_does_not_close_client_session_when_not_needed(api):
     api._client_session.close.assert_not_awaited()
 
 
-@pytest.mark.asyncio
-async def test_get_configuration(api):
+async def test_get_configuration(api, mock_request):
     """Test the get_configuration function."""
-    with patch.object(api, "_request", return_value=Mock()) as mock_request:
-        mock_request.return_value.get.return_value = {}
-        config = await api.get_configuration()
-        assert config == {}
+    mock_request.return_value.get.return_value = {}
+    config = await api.get_configuration()
+    assert config == {}
 
 
-@pytest.mark.asyncio
-async def test_get_datapoint(api):
+async def test_get_datapoint(api, mock_request):
     """Test the get_datapoint function."""
-    with patch.object(api, "_request", return_value=Mock()) as mock_request:
-        mock_request.return_value.get.return_value = {"values": ["value1", "value2"]}
-        datapoint = await api.get_datapoint("device_serial", "channel_id", "datapoint")
-        assert datapoint == ["value1", "value2"]
+    mock_request.return_value.get.return_value = {"values": ["value1", "value2"]}
+    datapoint = await api.get_datapoint("device_serial", "channel_id", "datapoint")
+    assert datapoint == ["value1", "value2"]
+
+
+async def test_get_datapoint_cached_within_ttl(api, mock_request):
+    """Test get_datapoint serves a repeated read from the cache."""
+    mock_request.return_value.get.return_value = {"values": ["value1"]}
+    first = await api.get_datapoint("device_serial", "channel_id", "datapoint")
+    second = await api.get_datapoint("device_serial", "channel_id", "datapoint")
+    assert first == second == ["value1"]
+    mock_request.assert_called_once()
 
 
-@pytest.mark.asyncio
-async def test_get_device_list(api):
+async def test_get_device_list(api, mock_request):
     """Test the get_device_list function."""
-    with patch.object(api, "_request", return_value=Mock()) as mock_request:
-        mock_request.return_value.get.return_value = ["device1", "device2"]
-        device_list = await api.get_device_list()
-        assert device_list == ["device1", "device2"]
+    mock_request.return_value.get.return_value = ["device1", "device2"]
+    device_list = await api.get_device_list()
+    assert device_list == ["device1", "device2"]
 
 
-@pytest.mark.asyncio
-async def test_get_device(api):
+async def test_get_device(api, mock_request):
     """Test the get_device function."""
-    with patch.object(api, "_request", return_value=Mock()) as mock_request:
-        mock_request.return_value.get.return_value = {
-            "devices": {"device_serial": "device_info"}
-        }
-        device = await api.get_device("device_serial")
-        assert device == "device_info"
+    mock_request.return_value.get.return_value = {
+        "devices": {"device_serial": "device_info"}
+    }
+    device = await api.get_device("device_serial")
+    assert device == "device_info"
 
 
-@pytest.mark.asyncio
-async def test_get_sysap(api):
+async def test_get_sysap(api, mock_request):
     """Test the get_sysap function."""
-    with patch.object(api, "_request", return_value=Mock()) as mock_request:
-        mock_request.return_value = {"sysap": "value"}
-        sysap = await api.get_sysap()
-        assert sysap == {"sysap": "value"}
+    mock_request.return_value = {"sysap": "value"}
+    sysap = await api.get_sysap()
+    assert sysap == {"sysap": "value"}
 
 
-@pytest.mark.asyncio
-async def test_set_datapoint(api):
+async def test_set_datapoint(api, mock_request):
     """Test the set_datapoint function."""
-    with patch.object(api, "_request", return_value=Mock()) as mock_request:
-        mock_request.return_value.get.return_value = {"result": "ok"}
-        result = await api.set_datapoint(
-            "device_serial", "channel_id", "datapoint", "value"
-        )
-        assert result is True
+    mock_request.return_value.get.return_value = {"result": "ok"}
+    result = await api.set_datapoint(
+        "device_serial", "channel_id", "datapoint", "value"
+    )
+    assert result is True
 
 
-@pytest.mark.asyncio
-async def test_virtualdevice(api):
+async def test_virtualdevice(api, mock_request):
     """Test the virtualdevice function."""
-    with patch.object(api, "_request", return_value=Mock()) as mock_request:
-        mock_request.return_value = {
-            "00000000-0000-0000-0000-000000000000": {
-                "devices": {"6000AAAAAAAA": {"serial": "test"}}
-            }
+    mock_request.return_value = {
+        "00000000-0000-0000-0000-000000000000": {
+            "devices": {"6000AAAAAAAA": {"serial": "test"}}
         }
-        result = await api.virtualdevice(
-            serial="test", data={"type": "testing", "properties": {"ttl": 0}}
-        )
-        assert result == {"test": "6000AAAAAAAA"}
+    }
+    result = await api.virtualdevice(
+        serial="test", data={"type": "testing", "properties": {"ttl": 0}}
+    )
+    assert result == {"test": "6000AAAAAAAA"}
 
     with pytest.raises(vol.error.Invalid):
         result = await api.virtualdevice(serial="test", data={"type": "testing"})
 
 
-@pytest.mark.asyncio
-async def test_set_datapoint_failure(api):
+async def test_set_datapoint_failure(api, mock_request):
     """Test the set_datapoint function for failure."""
-    with patch.object(api, "_request", return_value=Mock()) as mock_request:
-        mock_request.return_value.get.return_value = {"result": "fail"}
-        with pytest.raises(SetDatapointFailureException):
-            await api.set_datapoint("device_serial", "channel_id", "datapoint", "value")
+    mock_request.return_value.get.return_value = {"result": "fail"}
+    with pytest.raises(SetDatapointFailureException):
+        await api.set_datapoint("device_serial", "channel_id", "datapoint", "value")
 
 
-@pytest.mark.asyncio
 async def test_ws_connect(api):
     """Test the ws_connect function."""
     with patch("aiohttp.ClientSession.ws_connect", new_callable=AsyncMock):
         await api.ws_connect()
 
 
-@pytest.mark.asyncio
 async def test_ws_connect_already_connected(api):
     """Test the ws_connect function already connected."""
-    with patch.object(
-        FreeAtHomeApi, "ws_connected", new_callable=PropertyMock
-    ) as mock_ws_connected:
-        mock_ws_connected.return_value = True
-        with patch(
-            "aiohttp.ClientSession.ws_connect", new_callable=AsyncMock
-        ) as mock_ws_connect:
-            await api.ws_connect()
-            mock_ws_connect.assert_not_called()
+    api._ws_response = Mock(closed=False)
+
+    with patch(
+        "aiohttp.ClientSession.ws_connect", new_callable=AsyncMock
+    ) as mock_ws_connect:
+        await api.ws_connect()
+        mock_ws_connect.assert_not_called()
 
 
-@pytest.mark.asyncio
 async def test_ws_disconnect(api):
     """Test the ws_disconnect function."""
-    with patch.object(
-        FreeAtHomeApi, "ws_connected", new_callable=PropertyMock
-    ) as mock_ws_connected:
-        mock_ws_connected.return_value = True
-        with patch.object(
-            api, "_ws_response", new_callable=PropertyMock
-        ) as mock_ws_response:
-            mock_ws_response.return_value = AsyncMock()
-            with patch.object(
-                api._ws_response, "close", new_callable=AsyncMock
-            ) as mock_close:
-                await api.ws_disconnect()
-                mock_close.assert_called_once()
-
-
-@pytest.mark.asyncio
+    api._ws_response = Mock(closed=False, close=AsyncMock())
+
+    await api.ws_disconnect()
+    api._ws_response.close.assert_called_once()
+
+
 async def test_ws_disconnect_no_response(api):
     """Test the ws_disconnect function for no response."""
-    with patch.object(
-        FreeAtHomeApi, "ws_connected", new_callable=PropertyMock
-    ) as mock_ws_connected:
-        mock_ws_connected.return_value = True
-        with patch.object(
-            FreeAtHomeApi, "_ws_response", new_callable=PropertyMock
-        ) as mock_ws_response:
-            mock_ws_response.return_value = None
-            await api.ws_disconnect()
-            # Ensure no exception is raised and no call to close is made
-            assert True
-
-
-@pytest.mark.asyncio
+    api._ws_response = None
+
+    await api.ws_disconnect()
+    # Ensure no exception is raised and no call to close is made
+    assert True
+
+
 async def test_ws_close(api):
     """Test the ws_close function."""
     with (
@@ -420,306 +465,190 @@ async def test_ws_close(api):
         mock_ws_disconnect.assert_called_once()
 
 
-@pytest.mark.asyncio
 async def test_ws_receive(api):
     """Test the ws_receive function."""
     async_callback = AsyncMock()
     mock_callback = Mock()
 
-    with (
-        patch.object(
-            FreeAtHomeApi, "ws_connected", new_callable=PropertyMock
-        ) as mock_ws_connected,
-        patch.object(
-            FreeAtHomeApi, "_ws_response", new_callable=PropertyMock
-        ) as mock_ws_response,
-    ):
-        mock_ws_connected.return_value = True
-        mock_ws_response.return_value = Mock()
-        mock_ws_response.return_value.receive = AsyncMock(
-            return_value=Mock(
-                type=aiohttp.WSMsgType.TEXT,
-                json=Mock(return_value={api._sysap_uuid: "data"}),
-            )
-        )
-        with patch("asyncio.sleep", new_callable=AsyncMock):
-            # Check both async and non-async callbacks.
-            await api.ws_receive(async_callback)
-            async_callback.assert_called_once_with("data")
+    api._ws_response = _connected_ws_response(
+        _ws_message(aiohttp.WSMsgType.TEXT, {api._sysap_uuid: "data"})
+    )
 
-            await api.ws_receive(mock_callback)
-            async_callback.assert_called_once_with("data")
+    # Check both async and non-async callbacks.
+    await api.ws_receive(async_callback)
+    async_callback.assert_called_once_with("data")
+
+    await api.ws_receive(mock_callback)
+    async_callback.assert_called_once_with("data")
 
     # Test Different Connection Errors
     api._ws_response = None
     callback = AsyncMock()
-    with (
-        patch(
-            "aiohttp.ClientSession.ws_connect",
-            side_effect=aiohttp.ClientConnectionError,
-        ),
-        patch("asyncio.sleep", new_callable=AsyncMock),
+    with patch(
+        "aiohttp.ClientSession.ws_connect",
+        side_effect=aiohttp.ClientConnectionError,
     ):
         await api.ws_receive(callback)
         callback.assert_not_called()
 
-    with (
-        patch(
-            "aiohttp.ClientSession.ws_connect",
-            side_effect=aiohttp.WSServerHandshakeError(request_info=Mock, history=Mock),
-        ),
-        patch("asyncio.sleep", new_callable=AsyncMock),
+    with patch(
+        "aiohttp.ClientSession.ws_connect",
+        side_effect=aiohttp.WSServerHandshakeError(request_info=Mock, history=Mock),
     ):
         await api.ws_receive(callback)
         callback.assert_not_called()
 
-    with (
-        patch(
-            "aiohttp.ClientSession.ws_connect",
-            side_effect=TimeoutError,
-        ),
-        patch("asyncio.sleep", new_callable=AsyncMock),
+    with patch(
+        "aiohttp.ClientSession.ws_connect",
+        side_effect=TimeoutError,
     ):
         await api.ws_receive(callback)
         callback.assert_not_called()
 
 
-@pytest.mark.asyncio
+async def test_ws_receive_raw_text_frame(api):
+    """Test the ws_receive function decodes a real TEXT frame."""
+    callback = AsyncMock()
+    api._ws_response = _connected_ws_response(
+        aiohttp.WSMessage(
+            aiohttp.WSMsgType.TEXT, f'{{"{api._sysap_uuid}": ["data"]}}', None
+        )
+    )
+
+    await api.ws_receive(callback)
+    callback.assert_called_once_with(["data"])
+
+
 async def test_ws_receive_closed(api):
     """Test the ws_receive function for closed connection."""
     async_callback = AsyncMock()
-    with patch.object(
-        FreeAtHomeApi, "ws_connected", new_callable=PropertyMock
-    ) as mock_ws_connected:
-        mock_ws_connected.return_value = True
-        with patch.object(
-            FreeAtHomeApi, "_ws_response", new_callable=PropertyMock
-        ) as mock_ws_response:
-            mock_ws_response.return_value = Mock()
-            mock_ws_response.return_value.receive = AsyncMock(
-                return_value=Mock(type=aiohttp.WSMsgType.CLOSE)
-            )
-            with patch("asyncio.sleep", new_callable=AsyncMock):
-                await api.ws_receive(async_callback)
-                async_callback.assert_not_called()
-
-
-@pytest.mark.asyncio
+    api._ws_response = _connected_ws_response(_ws_message(aiohttp.WSMsgType.CLOSE))
+
+    await api.ws_receive(async_callback)
+    async_callback.assert_not_called()
+
+
 async def test_ws_receive_error(api):
     """Test the ws_receive function for error response."""
     async_callback = AsyncMock()
-    with patch.object(
-        FreeAtHomeApi, "ws_connected", new_callable=PropertyMock
-    ) as mock_ws_connected:
-        mock_ws_connected.return_value = True
-        with patch.object(
-            FreeAtHomeApi, "_ws_response", new_callable=PropertyMock
-        ) as mock_ws_response:
-            mock_ws_response.return_value = Mock()
-            mock_ws_response.return_value.receive = AsyncMock(
-                return_value=Mock(type=aiohttp.WSMsgType.ERROR)
-            )
-            with patch("asyncio.sleep", new_callable=AsyncMock):
-                await api.ws_receive(async_callback)
-                async_callback.assert_not_called()
-
-
-@pytest.mark.asyncio
+    api._ws_response = _connected_ws_response(_ws_message(aiohttp.WSMsgType.ERROR))
+
+    await api.ws_receive(async_callback)
+    async_callback.assert_not_called()
+
+
 async def test_ws_receive_ssl_error(api):
     """Test the ws_receive function for SSL error during connection."""
+    api._ws_response = None
+
     with patch.object(
-        FreeAtHomeApi, "ws_connected", new_callable=PropertyMock
-    ) as mock_ws_connected:
-        mock_ws_connected.return_value = False
-        with patch.object(
-            FreeAtHomeApi, "_ws_response", new_callable=PropertyMock
-        ) as mock_ws_response:
-            mock_ws_response.return_value = None
-
-            connection_key = Mock()
-            ssl_error = Mock()
-            with patch.object(
-                FreeAtHomeApi, "ws_connect", new_callable=AsyncMock
-            ) as mock_ws_connect:
-                mock_ws_connect.side_effect = aiohttp.client_exceptions.ClientSSLError(
-                    connection_key, ssl_error
-                )
-
-                with pytest.raises(SslErrorException):
-                    await api.ws_receive()
-
-
-@pytest.mark.asyncio
-async def test_request_success_json(api):
-    """Test the _request function for json response."""
-    with aioresponses() as m:
-        m.get(
-            f"{api._host}/fhapi/v1/test",
-            payload={"key": "value"},
-            status=200,
+        FreeAtHomeApi, "ws_connect", new_callable=AsyncMock
+    ) as mock_ws_connect:
+        mock_ws_connect.side_effect = aiohttp.client_exceptions.ClientSSLError(
+            _CONNECTION_KEY, _SSL_ERROR
         )
 
-        response = await api._request("test")
+        with pytest.raises(SslErrorException):
+            await api.ws_receive()
 
-        assert response == {"key": "value"}
 
+async def test_request_success_json(api, mock_aioresponse):
+    """Test the _request function for json response."""
+    mock_aioresponse.get(
+        f"{api._host}/fhapi/v1/test",
+        payload={"key": "value"},
+        status=200,
+    )
+
+    response = await api._request("test")
 
-@pytest.mark.asyncio
-async def test_request_success_text(api):
+    assert response == {"key": "value"}
+
+
+async def test_request_success_text(api, mock_aioresponse):
     """Test the _request function for text response."""
-    with aioresponses() as m:
-        m.get(
-            f"{api._host}/fhapi/v1/test",
-            body="plain text",
-            status=200,
-            content_type="text/plain",
-        )
+    mock_aioresponse.get(
+        f"{api._host}/fhapi/v1/test",
+        body="plain text",
+        status=200,
+        content_type="text/plain",
+    )
 
-        response = await api._request("test")
+    response = await api._request("test")
 
-        assert response == "plain text"
+    assert response == "plain text"
 
 
-@pytest.mark.asyncio
-async def test_request_success_other_content_type(api):
+async def test_request_success_other_content_type(api, mock_aioresponse):
     """Test the _request function for other content types."""
-    with aioresponses() as m:
-        m.get(
-            f"{api._host}/fhapi/v1/test",
-            body="custom content",
-            status=200,
-            content_type="application/xml",
-        )
+    mock_aioresponse.get(
+        f"{api._host}/fhapi/v1/test",
+        body="custom content",
+        status=200,
+        content_type="application/xml",
+    )
 
-        response = await api._request("test")
+    response = await api._request("test")
 
-        # Should return None for unsupported content types (the else branch)
-        assert response is None
+    # Should return None for unsupported content types (the else branch)
+    assert response is None
 
 
-@pytest.mark.asyncio
-async def test_request_invalid_host(api):
+async def test_request_invalid_host(fresh_api):
     """Test the _request function for invalid host."""
-    api._host = "192.168.1.1"
+    fresh_api._host = "192.168.1.1"
 
     with pytest.raises(InvalidHostException):
-        await api._request("/test")
+        await fresh_api._request("/test")
 
 
-@pytest.mark.asyncio
 async def test_request_client_connection_error(api):
-    """Test the _request function for an invalid client."""
-    api._host = "http://0.0.0.0:1"
-
-    try:
-        with pytest.raises(ClientConnectionError):
-            await api._request("/test")
-    finally:
-        # Cleanup any client session that might have been created during failed request
-        await api.close_client_session()
-
-
-@pytest.mark.asyncio
-async def test_request_ssl_certificate_error(api):
-    """Test the _request function for SSL certificate error."""
-    with patch.object(api, "_get_client_session") as mock_get_session:
-        mock_session = Mock()
-        connection_key = Mock()
-        ssl_error = Mock()
-        mock_session.request.side_effect = (
-            aiohttp.client_exceptions.ClientConnectorCertificateError(
-                connection_key, ssl_error
-            )
-        )
-        mock_get_session.return_value = mock_session
-
-        with pytest.raises(SslErrorException):
-            await api._request("/test")
-
-
-@pytest.mark.asyncio
-async def test_request_ssl_connector_error(api):
-    """Test the _request function for SSL connector error."""
+    """Test the _request function for a client connection error."""
     with patch.object(api, "_get_client_session") as mock_get_session:
-        mock_session = Mock()
-        connection_key = Mock()
-        ssl_error = Mock()
-        mock_session.request.side_effect = (
-            aiohttp.client_exceptions.ClientConnectorSSLError(connection_key, ssl_error)
+        mock_get_session.return_value.request.side_effect = (
+            aiohttp.client_exceptions.ClientConnectionError("boom")
         )
-        mock_get_session.return_value = mock_session
-
-        with pytest.raises(SslErrorException):
+        with pytest.raises(ClientConnectionError):
             await api._request("/test")
 
 
-@pytest.mark.asyncio
-async def test_request_client_ssl_error(api):
-    """Test the _request function for client SSL error."""
+@pytest.mark.parametrize(
+    "exception_class",
+    [
+        aiohttp.client_exceptions.ClientConnectorCertificateError,
+        aiohttp.client_exceptions.ClientConnectorSSLError,
+        aiohttp.client_exceptions.ClientSSLError,
+    ],
+)
+async def test_request_ssl_errors(api, exception_class):
+    """Test the _request function for the different SSL errors."""
     with patch.object(api, "_get_client_session") as mock_get_session:
-        mock_session = Mock()
-        connection_key = Mock()
-        ssl_error = Mock()
-        mock_session.request.side_effect = aiohttp.client_exceptions.ClientSSLError(
-            connection_key, ssl_error
+        mock_get_session.return_value.request.side_effect = exception_class(
+            _CONNECTION_KEY, _SSL_ERROR
         )
-        mock_get_session.return_value = mock_session
 
         with pytest.raises(SslErrorException):
             await api._request("/test")
 
 
-@pytest.mark.asyncio
-async def test_request_invalid_credentials(api):
-    """Test the _request function for invalid credentials."""
-    with aioresponses() as m:
-        m.get(f"{api._host}/fhapi/v1/test", status=401)
-
-        with pytest.raises(InvalidCredentialsException):
-            await api._request("/test")
-
-
-@pytest.mark.asyncio
-async def test_request_forbidden(api):
-    """Test the _request function for forbidden credentials."""
-    with aioresponses() as m:
-        m.get(f"{api._host}/fhapi/v1/test", status=403)
-
-        with pytest.raises(ForbiddenAuthException):
-            await api._request("/test")
-
-
-@pytest.mark.asyncio
-async def test_request_connection_timeout(api):
-    """Test the _request function for connection timeout."""
-    with aioresponses() as m:
-        m.get(f"{api._host}/fhapi/v1/test", status=502)
-
-        with pytest.raises(ConnectionTimeoutException):
-            await api._request("/test")
-
-
-@pytest.mark.asyncio
-async def test_request_invalid_api_response(api):
-    """Test the _request function for invalid api response."""
-    with aioresponses() as m:
-        m.get(f"{api._host}/fhapi/v1/test", status=500)
-
-        with pytest.raises(InvalidApiResponseException):
-            await api._request("/test")
-
-
-@pytest.mark.asyncio
-async def test_request_bad_request(api):
-    """Test the _request function for bad request api response."""
-    with aioresponses() as m:
-        m.get(f"{api._host}/fhapi/v1/test", status=400)
+@pytest.mark.parametrize(
+    ("status", "exception_class"),
+    [
+        (400, BadRequestException),
+        (401, InvalidCredentialsException),
+        (403, ForbiddenAuthException),
+        (500, InvalidApiResponseException),
+        (502, ConnectionTimeoutException),
+    ],
+)
+async def test_request_error_status(api, mock_aioresponse, status, exception_class):
+    """Test the _request function maps error statuses to exceptions."""
+    mock_aioresponse.get(f"{api._host}/fhapi/v1/test", status=status)
 
-        with pytest.raises(BadRequestException):
-            await api._request("/test")
+    with pytest.raises(exception_class):
+        await api._request("/test")
 
 
-@pytest.mark.asyncio
 async def test_settings_get_client_session_creates_new_session(settings):
     """Test _get_client_session creates a new session when none exists."""
     # Ensure no existing session
@@ -739,11 +668,10 @@ async def test_settings_get_client_session_creates_new_session(settings):
         await settings.close_client_session()
 
 
-@pytest.mark.asyncio
 async def test_settings_get_client_session_returns_existing_session(settings):
     """Test _get_client_session returns existing session when one exists."""
     # Set an existing session
-    mock_session = AsyncMock(spec=aiohttp.ClientSession)
+    mock_session = AsyncMock()
     settings._client_session = mock_session
     settings._close_client_session = False
 
@@ -755,7 +683,6 @@ async def test_settings_get_client_session_returns_existing_session(settings):
     assert settings._close_client_session is False
 
 
-@pytest.mark.asyncio
 async def test_get_client_session_creates_new_session(api):
     """Test _get_client_session creates a new session when none exists."""
     # Ensure no existing session
@@ -775,11 +702,10 @@ async def test_get_client_session_creates_new_session(api):
         await api.close_client_session()
 
 
-@pytest.mark.asyncio
 async def test_get_client_session_returns_existing_session(api):
     """Test _get_client_session returns existing session when one exists."""
     # Set an existing session
-    mock_session = AsyncMock(spec=aiohttp.ClientSession)
+    mock_session = AsyncMock()
     api._client_session = mock_session
     api._close_client_session = False
 
@@ -791,143 +717,59 @@ async def test_get_client_session_returns_existing_session(api):
     assert api._close_client_session is False
 
 
-@pytest.mark.asyncio
 async def test_ws_receive_with_non_async_callback(api):
     """Test the ws_receive function with non-async callback."""
     callback = Mock()
 
-    with patch.object(
-        FreeAtHomeApi, "ws_connected", new_callable=PropertyMock
-    ) as mock_ws_connected:
-        mock_ws_connected.return_value = True
-        with patch.object(
-            FreeAtHomeApi, "_ws_response", new_callable=PropertyMock
-        ) as mock_ws_response:
-            mock_ws_response.return_value = Mock()
-            mock_ws_response.return_value.receive = AsyncMock(
-                return_value=Mock(
-                    type=aiohttp.WSMsgType.TEXT,
-                    json=Mock(return_value={api._sysap_uuid: "test_data"}),
-                )
-            )
-
-            await api.ws_receive(callback)
-            callback.assert_called_once_with("test_data")
-
-
-@pytest.mark.asyncio
-async def test_ws_receive_no_callback(api):
-    """Test the ws_receive function with no callback."""
-    with patch.object(
-        FreeAtHomeApi, "ws_connected", new_callable=PropertyMock
-    ) as mock_ws_connected:
-        mock_ws_connected.return_value = True
-        with patch.object(
-            FreeAtHomeApi, "_ws_response", new_callable=PropertyMock
-        ) as mock_ws_response:
-            mock_ws_response.return_value = Mock()
-            mock_ws_response.return_value.receive = AsyncMock(
-                return_value=Mock(
-                    type=aiohttp.WSMsgType.TEXT,
-                    json=Mock(return_value={api._sysap_uuid: "test_data"}),
-                )
-            )
-
-            # Should not raise any exception when no callback is provided
-            await api.ws_receive(None)
-
-
-@pytest.mark.asyncio
-async def test_ws_receive_closed_message_types(api):
-    """Test the ws_receive function for all closed message types."""
-    async_callback = AsyncMock()
+    api._ws_response = _connected_ws_response(
+        _ws_message(aiohttp.WSMsgType.TEXT, {api._sysap_uuid: "test_data"})
+    )
 
-    # Test WSMsgType.CLOSED
-    with patch.object(
-        FreeAtHomeApi, "ws_connected", new_callable=PropertyMock
-    ) as mock_ws_connected:
-        mock_ws_connected.return_value = True
-        with patch.object(
-            FreeAtHomeApi, "_ws_response", new_callable=PropertyMock
-        ) as mock_ws_response:
-            mock_ws_response.return_value = Mock()
-            mock_ws_response.return_value.receive = AsyncMock(
-                return_value=Mock(type=aiohttp.WSMsgType.CLOSED)
-            )
-            with patch("asyncio.sleep", new_callable=AsyncMock) as mock_sleep:
-                await api.ws_receive(async_callback)
-                async_callback.assert_not_called()
-                # Verify sleep is NOT called for CLOSED messages (unlike ERROR messages)
-                mock_sleep.assert_not_called()
+    await api.ws_receive(callback)
+    callback.assert_called_once_with("test_data")
 
-    # Test WSMsgType.CLOSING
-    with patch.object(
-        FreeAtHomeApi, "ws_connected", new_callable=PropertyMock
-    ) as mock_ws_connected:
-        mock_ws_connected.return_value = True
-        with patch.object(
-            FreeAtHomeApi, "_ws_response", new_callable=PropertyMock
-        ) as mock_ws_response:
-            mock_ws_response.return_value = Mock()
-            mock_ws_response.return_value.receive = AsyncMock(
-                return_value=Mock(type=aiohttp.WSMsgType.CLOSING)
-            )
-            with patch("asyncio.sleep", new_callable=AsyncMock) as mock_sleep:
-                await api.ws_receive(async_callback)
-                async_callback.assert_not_called()
-                # Verify sleep is NOT called for CLOSING messages
-                mock_sleep.assert_not_called()
-
-
-@pytest.mark.asyncio
-async def test_ws_receive_close_message_simple(api):
-    """Test the ws_receive function for WSMsgType.CLOSE with simple test."""
-    # Set up the websocket as connected
-    api._ws_response = AsyncMock()
-    api._ws_response.closed = False
 
-    # Mock the receive to return a CLOSE message
-    api._ws_response.receive = AsyncMock(
-        return_value=Mock(type=aiohttp.WSMsgType.CLOSE)
+async def test_ws_receive_no_callback(api):
+    """Test the ws_receive function with no callback."""
+    api._ws_response = _connected_ws_response(
+        _ws_message(aiohttp.WSMsgType.TEXT, {api._sysap_uuid: "test_data"})
     )
 
-    # Call ws_receive and ensure it completes without error
-    await api.ws_receive()
-
-    # Verify receive was called
-    api._ws_response.receive.assert_called_once()
+    # Should not raise any exception when no callback is provided
+    await api.ws_receive(None)
 
 
-@pytest.mark.asyncio
-async def test_ws_receive_close_no_sleep_mock(api):
-    """Test ws_receive with CLOSE message without mocking sleep."""
-    api._ws_response = AsyncMock()
-    api._ws_response.closed = False
-    api._ws_response.receive = AsyncMock(
-        return_value=Mock(type=aiohttp.WSMsgType.CLOSE)
-    )
-
-    # Don't mock asyncio.sleep to allow natural function flow
-    result = await api.ws_receive()
+async def test_ws_receive_closed_message_types(api, mock_sleep):
+    """Test the ws_receive function for all closed message types."""
+    async_callback = AsyncMock()
 
-    # Function should complete and return None (implicit return)
-    assert result is None
+    # Test WSMsgType.CLOSED
+    api._ws_response = _connected_ws_response(_ws_message(aiohttp.WSMsgType.CLOSED))
+    await api.ws_receive(async_callback)
+    async_callback.assert_not_called()
+    # Verify sleep is NOT called for CLOSED messages (unlike ERROR messages)
+    mock_sleep.assert_not_called()
 
+    # Test WSMsgType.CLOSING
+    api._ws_response = _connected_ws_response(_ws_message(aiohttp.WSMsgType.CLOSING))
+    await api.ws_receive(async_callback)
+    async_callback.assert_not_called()
+    # Verify sleep is NOT called for CLOSING messages
+    mock_sleep.assert_not_called()
 
-@pytest.mark.asyncio
-async def test_ws_receive_unknown_message_type(api):
-    """Test ws_receive with unknown message type to cover the implicit else branch."""
-    api._ws_response = AsyncMock()
-    api._ws_response.closed = False
 
-    # Use a message type that doesn't match any of the elif conditions
-    api._ws_response.receive = AsyncMock(
-        return_value=Mock(type=aiohttp.WSMsgType.BINARY)  # Different message type
-    )
+@pytest.mark.parametrize(
+    "message_type", [aiohttp.WSMsgType.CLOSE, aiohttp.WSMsgType.BINARY]
+)
+async def test_ws_receive_terminal_message_types(api, message_type, mock_sleep):
+    """Test the ws_receive function returns cleanly for non-TEXT message types."""
+    api._ws_response = _connected_ws_response(_ws_message(message_type))
 
-    # Function should complete without error even for unknown message types
     result = await api.ws_receive()
+
     assert result is None
+    api._ws_response.receive.assert_called_once()
+    mock_sleep.assert_not_called()
 
 
 def test_settings_get_ssl_context_no_verify():
@@ -941,6 +783,7 @@ def test_settings_get_ssl_context_with_cert_path():
     settings = FreeAtHomeSettings(
         host="http://192.168.1.1", verify_ssl=True, ssl_cert_ca_file="dummy_path"
     )
+    _build_ssl_context.cache_clear()
     with patch("ssl.create_default_context") as mock_create_context:
         mock_context = Mock()
         mock_create_context.return_value = mock_context
@@ -966,9 +809,44 @@ def test_api_get_ssl_context_with_cert_path():
         verify_ssl=True,
         ssl_cert_ca_file="dummy_path",
     )
+    _build_ssl_context.cache_clear()
     with patch("ssl.create_default_context") as mock_create_context:
         mock_context = Mock()
         mock_create_context.return_value = mock_context
         context = api._get_ssl_context()
         assert context is mock_context
         mock_create_context.assert_called_once_with(cafile="dummy_path")
+
+
+def test_api_ssl_context_shared_across_instances():
+    """Test separate instances with the same CA file share one SSLContext."""
+    api_kwargs = {
+        "host": "http://192.168.1.1",
+        "username": "user",
+        "password": "pass",
+        "verify_ssl": True,
+        "ssl_cert_ca_file": "dummy_path",
+    }
+    _build_ssl_context.cache_clear()
+    with patch("ssl.create_default_context") as mock_create_context:
+        mock_create_context.return_value = Mock()
+        first = FreeAtHomeApi(**api_kwargs)
+        second = FreeAtHomeApi(**api_kwargs)
+        assert first._get_ssl_context() is second._get_ssl_context()
+        mock_create_context.assert_called_once_with(cafile="dummy_path")
+
+
+def test_api_get_ssl_context_cached_across_calls():
+    """Test _get_ssl_context builds the context for a CA file only once."""
+    api = FreeAtHomeApi(
+        host="http://192.168.1.1",
+        username="user",
+        password="pass",
+        verify_ssl=True,
+        ssl_cert_ca_file="dummy_path",
+    )
+    _build_ssl_context.cache_clear()
+    with patch("ssl.create_default_context") as mock_create_context:
+        mock_create_context.return_value = Mock()
+        assert api._get_ssl_context() is api._get_ssl_context()
+        mock_create_context.assert_called_once_with(cafile="dummy_path")
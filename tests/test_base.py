@@ -29,7 +29,7 @@ def mock_device():
 
 
 @pytest.fixture
-def base_instance(mock_api, mock_device):
+def base_instance(mock_api, mock_device, monkeypatch):
     """Set up the base instance for testing the Base channel."""
     mock_device.device_serial = "ABB7F500E17A"
     mock_device.display_name = "Device Name"
@@ -50,7 +50,11 @@ def base_instance(mock_api, mock_device):
         "par00f6": "2700",
     }
 
-    instance = Base(
+    # Base is slotted, so the callback attributes are patched on the class
+    # rather than assigned per instance.
+    monkeypatch.setattr(Base, "_callback_attributes", ["test"])
+
+    return Base(
         device=mock_device,
         channel_id="ch0003",
         channel_name="Channel Name",
@@ -60,8 +64,6 @@ def base_instance(mock_api, mock_device):
         floor_name="Ground Floor",
         room_name="Study",
     )
-    instance._callback_attributes = ["test"]
-    return instance
 
 
 def test_initialization(base_instance):
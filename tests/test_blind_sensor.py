@@ -45,13 +45,11 @@ def blind_sensor(mock_api, mock_device):
     )
 
 
-@pytest.mark.asyncio
 async def test_initial_state(blind_sensor):
     """Test the intial state of the blind-sensor."""
     assert blind_sensor.state == BlindSensorState.step_up.name
 
 
-@pytest.mark.asyncio
 async def test_refresh_state(blind_sensor):
     """Test refreshing the state of the blind-sensor."""
     blind_sensor.device.api.get_datapoint.return_value = ["1"]
@@ -67,27 +65,19 @@ async def test_refresh_state(blind_sensor):
 def test_refresh_state_from_datapoint(blind_sensor):
     """Test the _refresh_state_from_datapoint function."""
     # Check output that affects the state.
-    blind_sensor._refresh_state_from_datapoint(
-        datapoint={"pairingID": 33, "value": "1"},
-    )
+    blind_sensor._refresh_state_from_datapoint(pairing_id=33, value="1")
     assert blind_sensor.state == BlindSensorState.step_down.name
     assert blind_sensor.step_state == BlindSensorState.step_down.name
 
-    blind_sensor._refresh_state_from_datapoint(
-        datapoint={"pairingID": 32, "value": "1"},
-    )
+    blind_sensor._refresh_state_from_datapoint(pairing_id=32, value="1")
     assert blind_sensor.state == BlindSensorState.move_down.name
     assert blind_sensor.move_state == BlindSensorState.move_down.name
 
     # Test unknown values
-    blind_sensor._refresh_state_from_datapoint(
-        datapoint={"pairingID": 32, "value": "INVALID"},
-    )
+    blind_sensor._refresh_state_from_datapoint(pairing_id=32, value="INVALID")
     assert blind_sensor.state == BlindSensorState.unknown.name
     assert blind_sensor.move_state == BlindSensorState.unknown.name
 
-    blind_sensor._refresh_state_from_datapoint(
-        datapoint={"pairingID": 33, "value": "INVALID"},
-    )
+    blind_sensor._refresh_state_from_datapoint(pairing_id=33, value="INVALID")
     assert blind_sensor.state == BlindSensorState.unknown.name
     assert blind_sensor.step_state == BlindSensorState.unknown.name
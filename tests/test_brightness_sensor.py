@@ -50,14 +50,12 @@ def mock_device():
     return MagicMock(spec=Device)
 
 
-@pytest.mark.asyncio
 async def test_initial_state(brightness_sensor):
     """Test the intial state of the sensor."""
     assert brightness_sensor.state == 300.50
     assert brightness_sensor.alarm is False
 
 
-@pytest.mark.asyncio
 async def test_refresh_state(brightness_sensor):
     """Test refreshing the state of the sensor."""
     brightness_sensor.device.api.get_datapoint.return_value = ["1"]
@@ -74,19 +72,13 @@ async def test_refresh_state(brightness_sensor):
 def test_refresh_state_from_datapoint(brightness_sensor):
     """Test the _refresh_state_from_datapoint function."""
     # Check output that affects the state.
-    brightness_sensor._refresh_state_from_datapoint(
-        datapoint={"pairingID": 1027, "value": "50.7"},
-    )
+    brightness_sensor._refresh_state_from_datapoint(pairing_id=1027, value="50.7")
     assert brightness_sensor.state == 50.7
 
     # Check output that affects the state.
-    brightness_sensor._refresh_state_from_datapoint(
-        datapoint={"pairingID": 1026, "value": "1"},
-    )
+    brightness_sensor._refresh_state_from_datapoint(pairing_id=1026, value="1")
     assert brightness_sensor.alarm is True
 
     # Check output that does NOT affect the state.
-    brightness_sensor._refresh_state_from_datapoint(
-        datapoint={"pairingID": 4, "value": "1"},
-    )
+    brightness_sensor._refresh_state_from_datapoint(pairing_id=4, value="1")
     assert brightness_sensor.state == 50.7
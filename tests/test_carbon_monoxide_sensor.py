@@ -44,13 +44,11 @@ def carbon_monoxide_sensor(mock_api, mock_device):
     )
 
 
-@pytest.mark.asyncio
 async def test_initial_state(carbon_monoxide_sensor):
     """Test the intial state of the carbon-monoxide-sensor."""
     assert carbon_monoxide_sensor.state is False
 
 
-@pytest.mark.asyncio
 async def test_refresh_state(carbon_monoxide_sensor):
     """Test refreshing the state of the carbon-monoxide-sensor."""
     carbon_monoxide_sensor.device.api.get_datapoint.return_value = ["1"]
@@ -66,13 +64,9 @@ async def test_refresh_state(carbon_monoxide_sensor):
 def test_refresh_state_from_datapoint(carbon_monoxide_sensor):
     """Test the _refresh_state_from_datapoint function."""
     # Check output that affects the state.
-    carbon_monoxide_sensor._refresh_state_from_datapoint(
-        datapoint={"pairingID": 708, "value": "1"},
-    )
+    carbon_monoxide_sensor._refresh_state_from_datapoint(pairing_id=708, value="1")
     assert carbon_monoxide_sensor.state is True
 
     # Check output that does NOT affect the state.
-    carbon_monoxide_sensor._refresh_state_from_datapoint(
-        datapoint={"pairingID": 4, "value": "1"},
-    )
+    carbon_monoxide_sensor._refresh_state_from_datapoint(pairing_id=4, value="1")
     assert carbon_monoxide_sensor.state is True
@@ -98,13 +98,11 @@ def shutter_actuator(mock_api, mock_device):
     )
 
 
-@pytest.mark.asyncio
 async def test_initial_state(cover_actuator):
     """Test the intial state of the RTC."""
     assert cover_actuator.state == CoverActuatorState.opened.name
 
 
-@pytest.mark.asyncio
 async def test_open(cover_actuator):
     """Test to open the cover."""
     await cover_actuator.open()
@@ -116,7 +114,6 @@ async def test_open(cover_actuator):
     )
 
 
-@pytest.mark.asyncio
 async def test_close(cover_actuator):
     """Test to close the cover."""
     await cover_actuator.close()
@@ -128,7 +125,6 @@ async def test_close(cover_actuator):
     )
 
 
-@pytest.mark.asyncio
 async def test_stop(cover_actuator):
     """Test to stop the cover."""
     interim = cover_actuator._state
@@ -143,7 +139,6 @@ async def test_stop(cover_actuator):
     cover_actuator._state = interim
 
 
-@pytest.mark.asyncio
 async def test_stop_when_not_moving(cover_actuator):
     """Test to stop the cover when it's not moving (should not call set_datapoint)."""
     # Set the cover state to something other than opening or closing
@@ -159,7 +154,6 @@ async def test_stop_when_not_moving(cover_actuator):
     cover_actuator.device.api.set_datapoint.assert_not_called()
 
 
-@pytest.mark.asyncio
 async def test_stop_when_closed(cover_actuator):
     """Test to stop the cover when it's in closed state (no set_datapoint call)."""
     # Set the cover state to closed
@@ -175,7 +169,6 @@ async def test_stop_when_closed(cover_actuator):
     cover_actuator.device.api.set_datapoint.assert_not_called()
 
 
-@pytest.mark.asyncio
 async def test_set_forced_position(cover_actuator):
     """Test to force a position of a cover."""
     await cover_actuator.set_forced_position(
@@ -221,7 +214,6 @@ async def test_set_forced_position(cover_actuator):
     assert cover_actuator.forced_position == CoverActuatorForcedPosition.unknown.name
 
 
-@pytest.mark.asyncio
 async def test_set_position(cover_actuator):
     """Test to set a specific position of the blind."""
     await cover_actuator.set_position(50)
@@ -252,7 +244,6 @@ async def test_set_position(cover_actuator):
     assert cover_actuator.position == 100
 
 
-@pytest.mark.asyncio
 async def test_set_tilt_position(shutter_actuator):
     """Test to set a specific tilt of the shutter."""
     await shutter_actuator.set_tilt_position(50)
@@ -283,59 +274,40 @@ async def test_set_tilt_position(shutter_actuator):
     assert shutter_actuator.tilt_position == 100
 
 
-@pytest.mark.asyncio
 async def test_refresh_state_from_datapoint(shutter_actuator):
     """Test the _refresh_state_from_datapoint function."""
     # Check output that affects the state
-    shutter_actuator._refresh_state_from_datapoint(
-        datapoint={"pairingID": 288, "value": "1"},
-    )
+    shutter_actuator._refresh_state_from_datapoint(pairing_id=288, value="1")
     assert shutter_actuator.state == CoverActuatorState.partly_opened.name
 
-    shutter_actuator._refresh_state_from_datapoint(
-        datapoint={"pairingID": 288, "value": "4"},
-    )
+    shutter_actuator._refresh_state_from_datapoint(pairing_id=288, value="4")
     assert shutter_actuator.state == CoverActuatorState.unknown.name
 
     # Check output that affects the forced position
-    shutter_actuator._refresh_state_from_datapoint(
-        datapoint={"pairingID": 257, "value": "2"}
-    )
+    shutter_actuator._refresh_state_from_datapoint(pairing_id=257, value="2")
     assert (
         shutter_actuator.forced_position == CoverActuatorForcedPosition.forced_open.name
     )
 
-    shutter_actuator._refresh_state_from_datapoint(
-        datapoint={"pairingID": 257, "value": "4"}
-    )
+    shutter_actuator._refresh_state_from_datapoint(pairing_id=257, value="4")
     assert shutter_actuator.forced_position == CoverActuatorForcedPosition.unknown.name
 
     # Check output that affects the position
-    shutter_actuator._refresh_state_from_datapoint(
-        datapoint={"pairingID": 289, "value": "35"}
-    )
+    shutter_actuator._refresh_state_from_datapoint(pairing_id=289, value="35")
     assert shutter_actuator.position == 35
 
     # Check output that affects the position with a float value
-    shutter_actuator._refresh_state_from_datapoint(
-        datapoint={"pairingID": 289, "value": "2.35294"}
-    )
+    shutter_actuator._refresh_state_from_datapoint(pairing_id=289, value="2.35294")
     assert shutter_actuator.position == 2
 
     # Check output that affects the tilt
-    shutter_actuator._refresh_state_from_datapoint(
-        datapoint={"pairingID": 290, "value": "45"}
-    )
+    shutter_actuator._refresh_state_from_datapoint(pairing_id=290, value="45")
     assert shutter_actuator._tilt_position == 45
 
     # Check output that affects the tile with a float value
-    shutter_actuator._refresh_state_from_datapoint(
-        datapoint={"pairingID": 290, "value": "4.9"}
-    )
+    shutter_actuator._refresh_state_from_datapoint(pairing_id=290, value="4.9")
     assert shutter_actuator._tilt_position == 4
 
     # Check output that does NOT affects the RTC
-    shutter_actuator._refresh_state_from_datapoint(
-        datapoint={"pairingID": 0, "value": "1"},
-    )
+    shutter_actuator._refresh_state_from_datapoint(pairing_id=0, value="1")
     assert shutter_actuator.position == 2
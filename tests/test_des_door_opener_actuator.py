@@ -46,13 +46,11 @@ def des_door_opener_actuator(mock_api, mock_device):
     )
 
 
-@pytest.mark.asyncio
 async def test_initial_state(des_door_opener_actuator):
     """Test the intial state of the DesDoorOpenerActuator."""
     assert des_door_opener_actuator.state is False
 
 
-@pytest.mark.asyncio
 async def test_lock(des_door_opener_actuator):
     """Test to lock."""
     await des_door_opener_actuator.lock()
@@ -65,7 +63,6 @@ async def test_lock(des_door_opener_actuator):
     )
 
 
-@pytest.mark.asyncio
 async def test_unlock(des_door_opener_actuator):
     """Test to unlock."""
     await des_door_opener_actuator.unlock()
@@ -78,7 +75,6 @@ async def test_unlock(des_door_opener_actuator):
     )
 
 
-@pytest.mark.asyncio
 async def test_refresh_state(des_door_opener_actuator):
     """Test refreshing the state of the DesDoorOpenerActuator."""
     des_door_opener_actuator.device.api.get_datapoint.return_value = ["1"]
@@ -44,14 +44,10 @@ def des_door_ringing_sensor(mock_api, mock_device):
 def test_refresh_state_from_datapoint(des_door_ringing_sensor):
     """Test the _refresh_state_from_datapoint function."""
     assert (
-        des_door_ringing_sensor._refresh_state_from_datapoint(
-            datapoint={"pairingID": 2, "value": "1"},
-        )
+        des_door_ringing_sensor._refresh_state_from_datapoint(pairing_id=2, value="1")
         == "state"
     )
     assert (
-        des_door_ringing_sensor._refresh_state_from_datapoint(
-            datapoint={"pairingID": 4, "value": "1"},
-        )
+        des_door_ringing_sensor._refresh_state_from_datapoint(pairing_id=4, value="1")
         is None
     )
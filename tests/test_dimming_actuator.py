@@ -86,13 +86,11 @@ def colortemperature_actuator(mock_api, mock_device):
     )
 
 
-@pytest.mark.asyncio
 async def test_initial_state(dimming_actuator):
     """Test the intial state of the DimmingActuator."""
     assert dimming_actuator.state is False
 
 
-@pytest.mark.asyncio
 async def test_turn_on(dimming_actuator):
     """Test to turning on the DimmingActuator."""
     await dimming_actuator.turn_on()
@@ -105,7 +103,6 @@ async def test_turn_on(dimming_actuator):
     )
 
 
-@pytest.mark.asyncio
 async def test_turn_off(dimming_actuator):
     """Test to turning off the DimmingActuator."""
     await dimming_actuator.turn_off()
@@ -118,7 +115,6 @@ async def test_turn_off(dimming_actuator):
     )
 
 
-@pytest.mark.asyncio
 async def test_set_brightness(dimming_actuator):
     """Test to set brightness off the DimmingActuator."""
     await dimming_actuator.set_brightness(50)
@@ -129,7 +125,6 @@ async def test_set_brightness(dimming_actuator):
     assert dimming_actuator.brightness == 100
 
 
-@pytest.mark.asyncio
 async def test_set_forced(dimming_actuator):
     """Test to set the forced option of the DimmingActuator."""
     await dimming_actuator.set_forced_position(
@@ -177,7 +172,6 @@ async def test_set_forced(dimming_actuator):
     )
 
 
-@pytest.mark.asyncio
 async def test_refresh_state(dimming_actuator):
     """Test refreshing the state of the DimmingActuator."""
     dimming_actuator.device.api.get_datapoint.return_value = ["1"]
@@ -193,29 +187,20 @@ async def test_refresh_state(dimming_actuator):
 def test_refresh_state_from_datapoint(dimming_actuator):
     """Test the _refresh_state_from_datapoint function."""
     # Check output that affects the state.
-    dimming_actuator._refresh_state_from_datapoint(
-        datapoint={"pairingID": 256, "value": "1"},
-    )
+    dimming_actuator._refresh_state_from_datapoint(pairing_id=256, value="1")
     assert dimming_actuator.state is True
 
     # Check output that affects the brightness
-    dimming_actuator._refresh_state_from_datapoint(
-        datapoint={"pairingID": 272, "value": "75"},
-    )
+    dimming_actuator._refresh_state_from_datapoint(pairing_id=272, value="75")
     assert dimming_actuator.brightness == 75
 
     # Check output that affects the brightness with a float value
-    dimming_actuator._refresh_state_from_datapoint(
-        datapoint={"pairingID": 272, "value": "7.5"}
-    )
+    dimming_actuator._refresh_state_from_datapoint(pairing_id=272, value="7.5")
     assert dimming_actuator.brightness == 7
 
     # Check output that affects the force-option
     dimming_actuator._refresh_state_from_datapoint(
-        datapoint={
-            "pairingID": 257,
-            "value": DimmingActuatorForcedPosition.forced_on.value,
-        },
+        pairing_id=257, value=DimmingActuatorForcedPosition.forced_on.value
     )
     assert (
         dimming_actuator.forced_position == DimmingActuatorForcedPosition.forced_on.name
@@ -244,7 +229,6 @@ def test_update_channel(dimming_actuator):
     assert dimming_actuator.state is False
 
 
-@pytest.mark.asyncio
 async def test_set_color_temperature(colortemperature_actuator):
     """Test to set the color temperature of the ColorTemperatureActuator."""
     await colortemperature_actuator.set_color_temperature(50)
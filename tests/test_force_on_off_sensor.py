@@ -47,13 +47,11 @@ def force_on_off_sensor(mock_api, mock_device):
     )
 
 
-@pytest.mark.asyncio
 async def test_initial_state(force_on_off_sensor):
     """Test the intial state of the force-on-off-sensor."""
     assert force_on_off_sensor.state == ForceOnOffSensorState.off.name
 
 
-@pytest.mark.asyncio
 async def test_refresh_state(force_on_off_sensor):
     """Test refreshing the state of the force-on-off-sensor."""
     force_on_off_sensor.device.api.get_datapoint.return_value = ["1"]
@@ -69,27 +67,17 @@ async def test_refresh_state(force_on_off_sensor):
 def test_refresh_state_from_datapoint(force_on_off_sensor):
     """Test the _refresh_state_from_datapoint function."""
     # Check output that affects the state.
-    force_on_off_sensor._refresh_state_from_datapoint(
-        datapoint={"pairingID": 3, "value": "0"},
-    )
+    force_on_off_sensor._refresh_state_from_datapoint(pairing_id=3, value="0")
     assert force_on_off_sensor.state == ForceOnOffSensorState.off.name
 
-    force_on_off_sensor._refresh_state_from_datapoint(
-        datapoint={"pairingID": 3, "value": "1"},
-    )
+    force_on_off_sensor._refresh_state_from_datapoint(pairing_id=3, value="1")
     assert force_on_off_sensor.state == ForceOnOffSensorState.off.name
 
-    force_on_off_sensor._refresh_state_from_datapoint(
-        datapoint={"pairingID": 3, "value": "2"},
-    )
+    force_on_off_sensor._refresh_state_from_datapoint(pairing_id=3, value="2")
     assert force_on_off_sensor.state == ForceOnOffSensorState.on.name
 
-    force_on_off_sensor._refresh_state_from_datapoint(
-        datapoint={"pairingID": 3, "value": "3"},
-    )
+    force_on_off_sensor._refresh_state_from_datapoint(pairing_id=3, value="3")
     assert force_on_off_sensor.state == ForceOnOffSensorState.on.name
 
-    force_on_off_sensor._refresh_state_from_datapoint(
-        datapoint={"pairingID": 3, "value": "INVALID"},
-    )
+    force_on_off_sensor._refresh_state_from_datapoint(pairing_id=3, value="INVALID")
     assert force_on_off_sensor.state == ForceOnOffSensorState.unknown.name
@@ -363,7 +363,6 @@ def freeathome_virtuals(api_mock):
     )
 
 
-@pytest.mark.asyncio
 async def test_get_config(freeathome, api_mock):
     """Test the get_config function."""
     config = await freeathome.get_config()
@@ -371,7 +370,6 @@ async def test_get_config(freeathome, api_mock):
     api_mock.get_configuration.assert_called_once()
 
 
-@pytest.mark.asyncio
 async def test_get_config_with_refresh(api_mock):
     """Test the get_config function with refresh=True."""
     freeathome = FreeAtHome(api_mock)
@@ -391,7 +389,6 @@ async def test_get_config_with_refresh(api_mock):
     api_mock.get_configuration.assert_called_once()
 
 
-@pytest.mark.asyncio
 async def test_get_config_cached(api_mock):
     """Test that get_config returns cached config when not refreshing."""
     freeathome = FreeAtHome(api_mock)
@@ -415,7 +412,6 @@ async def test_get_config_cached(api_mock):
     api_mock.get_configuration.assert_not_called()  # Should still not be called
 
 
-@pytest.mark.asyncio
 async def test_get_channels_by_class(freeathome):
     """Test the get_channels_by_class function."""
     await freeathome.load()
@@ -424,7 +420,6 @@ async def test_get_channels_by_class(freeathome):
     assert len(devices) == 2
 
 
-@pytest.mark.asyncio
 async def test_get_channels_by_device(freeathome):
     """Test the get_channels_by_device function."""
     await freeathome.load()
@@ -459,7 +454,6 @@ async def test_get_channels_by_device(freeathome):
     assert len(channels_filtered) == 0
 
 
-@pytest.mark.asyncio
 async def test_load(freeathome):
     """Test the load function."""
     await freeathome.load()
@@ -489,7 +483,6 @@ async def test_load(freeathome):
     assert len(channels) == 4
 
 
-@pytest.mark.asyncio
 async def test_load_with_orphans(freeathome_orphans):
     """Test the load function."""
     await freeathome_orphans.load()
@@ -510,7 +503,6 @@ async def test_load_with_orphans(freeathome_orphans):
     assert channels[channel_key].room_name is None
 
 
-@pytest.mark.asyncio
 async def test_load_with_virtuals(freeathome_virtuals):
     """Test the load function."""
     await freeathome_virtuals.load()
@@ -532,7 +524,6 @@ async def test_load_with_virtuals(freeathome_virtuals):
     assert channels[channel_key].is_virtual is True
 
 
-@pytest.mark.asyncio
 async def test_ws_close(freeathome, api_mock):
     "Test the ws_close function."
     api_mock.ws_close = AsyncMock()
@@ -540,7 +531,6 @@ async def test_ws_close(freeathome, api_mock):
     api_mock.ws_close.assert_called_once_with()
 
 
-@pytest.mark.asyncio
 async def test_ws_listen(freeathome, api_mock):
     "Test the ws_listen function."
     api_mock.ws_listen = AsyncMock()
@@ -548,7 +538,6 @@ async def test_ws_listen(freeathome, api_mock):
     api_mock.ws_listen.assert_called_once_with(callback=freeathome.update)
 
 
-@pytest.mark.asyncio
 async def test_update(freeathome):
     """Test the update function."""
     # Create a mock channel
@@ -579,7 +568,6 @@ async def test_update(freeathome):
     channel.update_channel.assert_called_once_with("ABB7F500E17A/ch0003/256", "0")
 
 
-@pytest.mark.asyncio
 async def test_device_interface_enum_conversion(api_mock):
     """Test that interface strings are properly converted to Interface enums."""
     api_mock.get_configuration = AsyncMock(
@@ -639,7 +627,6 @@ async def test_device_interface_enum_conversion(api_mock):
     assert virtual_device.is_virtual is True
 
 
-@pytest.mark.asyncio
 async def test_load_devices_functionality(api_mock):
     """Test the load_devices method and device-related functionality."""
     freeathome = FreeAtHome(api_mock)
@@ -670,7 +657,6 @@ async def test_load_devices_functionality(api_mock):
     assert len(freeathome.get_devices()) == 0
 
 
-@pytest.mark.asyncio
 async def test_unload_device(api_mock):
     """Test unloading devices by serial."""
     freeathome = FreeAtHome(api_mock)
@@ -691,7 +677,6 @@ async def test_unload_device(api_mock):
     assert len(freeathome.get_devices()) == initial_count - 1
 
 
-@pytest.mark.asyncio
 async def test_interface_conversion_mapping(api_mock):
     """Test the interface string to enum conversion mapping."""
     # Create a custom API mock with specific interface types
@@ -807,7 +792,6 @@ async def test_interface_conversion_mapping(api_mock):
         )
 
 
-@pytest.mark.asyncio
 async def test_device_floor_room_names(api_mock):
     """Test that device floor and room names are properly populated."""
     freeathome = FreeAtHome(api_mock)
@@ -836,7 +820,6 @@ async def test_device_floor_room_names(api_mock):
     assert no_location_device.room_name is None
 
 
-@pytest.mark.asyncio
 async def test_clear_channels(api_mock):
     """Test the clear_channels method."""
     freeathome = FreeAtHome(api_mock)
@@ -858,7 +841,6 @@ async def test_clear_channels(api_mock):
     assert freeathome._filtered_channels is None
 
 
-@pytest.mark.asyncio
 async def test_channel_class_filtering(api_mock):
     """Test filtering channels by channel class."""
     # Initialize FreeAtHome with specific channel class filter
@@ -877,7 +859,6 @@ async def test_channel_class_filtering(api_mock):
         assert isinstance(channel, SwitchActuator)
 
 
-@pytest.mark.asyncio
 async def test_unload_channel_by_id(api_mock):
     """Test unloading specific channels by channel serial."""
     freeathome = FreeAtHome(api_mock)
@@ -902,7 +883,6 @@ async def test_unload_channel_by_id(api_mock):
     assert len(updated_channels) == initial_count - 1
 
 
-@pytest.mark.asyncio
 async def test_unload_channel_invalid_serial(api_mock):
     """Test unloading channel with invalid channel serial."""
     freeathome = FreeAtHome(api_mock)
@@ -1,27 +1,35 @@
 """Test class to test the HeatingActuator channel."""
 
-from unittest.mock import AsyncMock, MagicMock
+from types import SimpleNamespace
+from unittest.mock import Mock
 
 import pytest
 
-from src.abbfreeathome.api import FreeAtHomeApi
 from src.abbfreeathome.channels.heating_actuator import HeatingActuator
-from src.abbfreeathome.device import Device
+from tests.conftest import FakeApi
 
+# Kwargs shared by every set_datapoint assertion; built once instead of
+# repeating (and rebuilding) the same dict literal in each call.
+_SET_DATAPOINT_CALL = {
+    "device_serial": "ABB289613651",
+    "channel_id": "ch0002",
+    "datapoint": "idp0000",
+}
 
-@pytest.fixture
+
+@pytest.fixture(scope="module")
 def mock_api():
     """Create a mock api function."""
-    return AsyncMock(spec=FreeAtHomeApi)
+    return FakeApi()
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mock_device():
     """Create a mock device function."""
-    return MagicMock(spec=Device)
+    return SimpleNamespace(device_serial=None, api=None)
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def heating_actuator(mock_api, mock_device):
     """Set up the heating actuator instance for testing the HeatingActuator channel."""
     inputs = {
@@ -46,60 +54,61 @@ def heating_actuator(mock_api, mock_device):
     )
 
 
-@pytest.mark.asyncio
+@pytest.fixture(autouse=True)
+def _reset_heating_actuator(heating_actuator):
+    """Reset the module-scoped actuator state between tests."""
+    heating_actuator._position = 0
+    heating_actuator.device.api.set_datapoint.reset_mock(
+        return_value=True, side_effect=True
+    )
+
+
 async def test_initial_state(heating_actuator):
     """Test the intial state of the HeatingActuator."""
     assert heating_actuator.position == 0
 
 
-@pytest.mark.asyncio
-async def test_set_position(heating_actuator):
+@pytest.mark.parametrize(
+    ("requested", "sent", "position"),
+    [
+        (50, "50", 50),
+        # Also checking lower and upper boundaries
+        (-1, "0", 0),
+        (120, "100", 100),
+    ],
+)
+async def test_set_position(heating_actuator, requested, sent, position):
     """Test to set a specific position of the HeatingActuator."""
-    await heating_actuator.set_position(50)
+    await heating_actuator.set_position(requested)
     heating_actuator.device.api.set_datapoint.assert_called_with(
-        device_serial="ABB289613651",
-        channel_id="ch0002",
-        datapoint="idp0000",
-        value="50",
+        **_SET_DATAPOINT_CALL, value=sent
     )
-    assert heating_actuator.position == 50
-
-    # Also checking lower and upper boundaries
-    await heating_actuator.set_position(-1)
-    heating_actuator.device.api.set_datapoint.assert_called_with(
-        device_serial="ABB289613651",
-        channel_id="ch0002",
-        datapoint="idp0000",
-        value="0",
-    )
-    assert heating_actuator.position == 0
-    await heating_actuator.set_position(120)
-    heating_actuator.device.api.set_datapoint.assert_called_with(
-        device_serial="ABB289613651",
-        channel_id="ch0002",
-        datapoint="idp0000",
-        value="100",
-    )
-    assert heating_actuator.position == 100
+    assert heating_actuator.position == position
 
 
-@pytest.mark.asyncio
 async def test_refresh_state_from_datapoint(heating_actuator):
     """Test the _refresh_state_from_datapoint function."""
     # Check output that affects the position
-    heating_actuator._refresh_state_from_datapoint(
-        datapoint={"pairingID": 305, "value": "35"}
-    )
+    heating_actuator._refresh_state_from_datapoint(pairing_id=305, value="35")
     assert heating_actuator.position == 35
 
     # Check output that affects the position with a float value
-    heating_actuator._refresh_state_from_datapoint(
-        datapoint={"pairingID": 305, "value": "3.5"}
-    )
+    heating_actuator._refresh_state_from_datapoint(pairing_id=305, value="3.5")
     assert heating_actuator.position == 3
 
     # Check output that does NOT affects the position
-    heating_actuator._refresh_state_from_datapoint(
-        datapoint={"pairingID": 273, "value": "1"},
-    )
+    heating_actuator._refresh_state_from_datapoint(pairing_id=273, value="1")
     assert heating_actuator.position == 3
+
+
+def test_refresh_state_idempotent(heating_actuator):
+    """Test repeated datapoints don't fire spurious callbacks."""
+    callback = Mock()
+    heating_actuator.register_callback(callback_attribute="position", callback=callback)
+
+    heating_actuator.update_channel("AL_INFO_VALUE_HEATING/odp0000", "35")
+    heating_actuator.update_channel("AL_INFO_VALUE_HEATING/odp0000", "35")
+
+    assert heating_actuator.position == 35
+    callback.assert_called_once()
+    heating_actuator.remove_callback(callback_attribute="position", callback=callback)
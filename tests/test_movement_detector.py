@@ -86,21 +86,18 @@ def blockable_movement_detector(mock_api, mock_device):
     return get_movement_detector("blockable", mock_api, mock_device)
 
 
-@pytest.mark.asyncio
 async def test_initial_state_indoor(indoor_movement_detector):
     """Test the intial state (indoor)."""
     assert indoor_movement_detector.state is False
     assert indoor_movement_detector.brightness == 1.6
 
 
-@pytest.mark.asyncio
 async def test_initial_state_outdoor(outdoor_movement_detector):
     """Test the intial state (outdoor)."""
     assert outdoor_movement_detector.state is False
     assert outdoor_movement_detector.brightness is None
 
 
-@pytest.mark.asyncio
 async def test_initial_state_blockable(blockable_movement_detector):
     """Test the intial state (blockable)."""
     assert blockable_movement_detector.state is False
@@ -108,7 +105,6 @@ async def test_initial_state_blockable(blockable_movement_detector):
     assert blockable_movement_detector.blocked is False
 
 
-@pytest.mark.asyncio
 async def test_refresh_state(indoor_movement_detector):
     """Test refreshing the state."""
     indoor_movement_detector.device.api.get_datapoint.side_effect = [
@@ -125,7 +121,6 @@ async def test_refresh_state(indoor_movement_detector):
     indoor_movement_detector.device.api.get_datapoint.assert_has_calls(_expected_calls)
 
 
-@pytest.mark.asyncio
 async def test_refresh_state_blockable(blockable_movement_detector):
     """Test refreshing the state (blockable)."""
     blockable_movement_detector.device.api.get_datapoint.side_effect = [
@@ -150,23 +145,19 @@ async def test_refresh_state_blockable(blockable_movement_detector):
 def test_refresh_state_from_datapoint(indoor_movement_detector):
     """Test the _refresh_state_from_datapoint function."""
     # Check output that affects the state.
-    indoor_movement_detector._refresh_state_from_datapoint(
-        datapoint={"pairingID": 6, "value": "1"},
-    )
+    indoor_movement_detector._refresh_state_from_datapoint(pairing_id=6, value="1")
     assert indoor_movement_detector.state is True
     assert indoor_movement_detector.brightness == 1.6
 
     # Check output that affects the state.
     indoor_movement_detector._refresh_state_from_datapoint(
-        datapoint={"pairingID": 1027, "value": "52.3"},
+        pairing_id=1027, value="52.3"
     )
     assert indoor_movement_detector.state is True
     assert indoor_movement_detector.brightness == 52.3
 
     # Check output that does NOT affect the state.
-    indoor_movement_detector._refresh_state_from_datapoint(
-        datapoint={"pairingID": 12, "value": "0"},
-    )
+    indoor_movement_detector._refresh_state_from_datapoint(pairing_id=12, value="0")
     assert indoor_movement_detector.state is True
     assert indoor_movement_detector.brightness == 52.3
 
@@ -174,39 +165,32 @@ def test_refresh_state_from_datapoint(indoor_movement_detector):
 def test_refresh_state_from_datapoint_blockable(blockable_movement_detector):
     """Test the _refresh_state_from_datapoint function (blockable)."""
     # Check output that affects the state.
-    blockable_movement_detector._refresh_state_from_datapoint(
-        datapoint={"pairingID": 6, "value": "1"},
-    )
+    blockable_movement_detector._refresh_state_from_datapoint(pairing_id=6, value="1")
     assert blockable_movement_detector.state is True
     assert blockable_movement_detector.brightness == 1.6
     assert blockable_movement_detector.blocked is False
 
     # Check output that affects the state.
     blockable_movement_detector._refresh_state_from_datapoint(
-        datapoint={"pairingID": 1027, "value": "52.3"},
+        pairing_id=1027, value="52.3"
     )
     assert blockable_movement_detector.state is True
     assert blockable_movement_detector.brightness == 52.3
     assert blockable_movement_detector.blocked is False
 
     # Check output that affects the state.
-    blockable_movement_detector._refresh_state_from_datapoint(
-        datapoint={"pairingID": 360, "value": "1"},
-    )
+    blockable_movement_detector._refresh_state_from_datapoint(pairing_id=360, value="1")
     assert blockable_movement_detector.state is True
     assert blockable_movement_detector.brightness == 52.3
     assert blockable_movement_detector.blocked is True
 
     # Check output that does NOT affect the state.
-    blockable_movement_detector._refresh_state_from_datapoint(
-        datapoint={"pairingID": 12, "value": "0"},
-    )
+    blockable_movement_detector._refresh_state_from_datapoint(pairing_id=12, value="0")
     assert blockable_movement_detector.state is True
     assert blockable_movement_detector.brightness == 52.3
     assert blockable_movement_detector.blocked is True
 
 
-@pytest.mark.asyncio
 async def test_block(blockable_movement_detector):
     """Test for blocking the sensor."""
     await blockable_movement_detector.turn_on_blocked()
@@ -219,7 +203,6 @@ async def test_block(blockable_movement_detector):
     )
 
 
-@pytest.mark.asyncio
 async def test_unblock(blockable_movement_detector):
     """Test for unblocking the sensor."""
     await blockable_movement_detector.turn_off_blocked()
@@ -51,13 +51,11 @@ def mock_device():
     return MagicMock(spec=Device)
 
 
-@pytest.mark.asyncio
 async def test_initial_state(rain_sensor):
     """Test the intial state of the sensor."""
     assert rain_sensor.state is False
 
 
-@pytest.mark.asyncio
 async def test_refresh_state(rain_sensor):
     """Test refreshing the state of the sensor."""
     rain_sensor.device.api.get_datapoint.return_value = ["1"]
@@ -73,13 +71,9 @@ async def test_refresh_state(rain_sensor):
 def test_refresh_state_from_datapoint(rain_sensor):
     """Test the _refresh_state_from_datapoint function."""
     # Check output that affects the state.
-    rain_sensor._refresh_state_from_datapoint(
-        datapoint={"pairingID": 39, "value": "1"},
-    )
+    rain_sensor._refresh_state_from_datapoint(pairing_id=39, value="1")
     assert rain_sensor.state is True
 
     # Check output that does NOT affect the state.
-    rain_sensor._refresh_state_from_datapoint(
-        datapoint={"pairingID": 4, "value": "1"},
-    )
+    rain_sensor._refresh_state_from_datapoint(pairing_id=4, value="1")
     assert rain_sensor.state is True
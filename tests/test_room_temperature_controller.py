@@ -55,13 +55,11 @@ def room_temperature_controller(mock_api, mock_device):
     )
 
 
-@pytest.mark.asyncio
 async def test_initial_state(room_temperature_controller):
     """Test the intial state of the RTC."""
     assert room_temperature_controller.state is True
 
 
-@pytest.mark.asyncio
 async def test_turn_on(room_temperature_controller):
     """Test to turning on the RTC."""
     await room_temperature_controller.turn_on()
@@ -74,7 +72,6 @@ async def test_turn_on(room_temperature_controller):
     )
 
 
-@pytest.mark.asyncio
 async def test_turn_off(room_temperature_controller):
     """Test to turning off the RTC."""
     await room_temperature_controller.turn_off()
@@ -87,7 +84,6 @@ async def test_turn_off(room_temperature_controller):
     )
 
 
-@pytest.mark.asyncio
 async def test_eco_on(room_temperature_controller):
     """Test to turning on the eco-mode."""
     await room_temperature_controller.eco_on()
@@ -100,7 +96,6 @@ async def test_eco_on(room_temperature_controller):
     )
 
 
-@pytest.mark.asyncio
 async def test_eco_off(room_temperature_controller):
     """Test to turning off the eco-mode."""
     await room_temperature_controller.eco_off()
@@ -113,7 +108,6 @@ async def test_eco_off(room_temperature_controller):
     )
 
 
-@pytest.mark.asyncio
 async def test_set_temperature(room_temperature_controller):
     """Test to set the target temperatuer of the RTC."""
     await room_temperature_controller.set_temperature(30)
@@ -143,7 +137,6 @@ async def test_set_temperature(room_temperature_controller):
     )
 
 
-@pytest.mark.asyncio
 async def test_refresh_state(room_temperature_controller):
     """Test refreshing state of the RTC."""
     room_temperature_controller.device.api.get_datapoint.return_value = ["1"]
@@ -156,76 +149,59 @@ async def test_refresh_state(room_temperature_controller):
     )
 
 
-@pytest.mark.asyncio
 async def test_refresh_state_from_datapoint(
     room_temperature_controller,
 ):
     """Test the _refresh_state_from_datapoint function."""
     # Check output that affects the target_temperature
-    room_temperature_controller._refresh_state_from_datapoint(
-        datapoint={"pairingID": 51, "value": "25"},
-    )
+    room_temperature_controller._refresh_state_from_datapoint(pairing_id=51, value="25")
     assert room_temperature_controller.target_temperature == 25
 
     # Check output that affects the state
-    room_temperature_controller._refresh_state_from_datapoint(
-        datapoint={"pairingID": 56, "value": "0"},
-    )
+    room_temperature_controller._refresh_state_from_datapoint(pairing_id=56, value="0")
     assert room_temperature_controller.state is False
 
     # Check output that affects state_indication and eco_mode
-    room_temperature_controller._refresh_state_from_datapoint(
-        datapoint={"pairingID": 54, "value": "68"}
-    )
+    room_temperature_controller._refresh_state_from_datapoint(pairing_id=54, value="68")
     assert room_temperature_controller.state_indication == 68
     assert room_temperature_controller.eco_mode is True
 
     # Check output that affects the current temperature
     room_temperature_controller._refresh_state_from_datapoint(
-        datapoint={"pairingID": 304, "value": "22.56"}
+        pairing_id=304, value="22.56"
     )
     assert room_temperature_controller.current_temperature == 22.56
 
     # Check output that reports an empty string for heating
-    room_temperature_controller._refresh_state_from_datapoint(
-        datapoint={"pairingID": 48, "value": ""}
-    )
+    room_temperature_controller._refresh_state_from_datapoint(pairing_id=48, value="")
     assert room_temperature_controller.heating == 0
 
     # Check output that affects the heating
-    room_temperature_controller._refresh_state_from_datapoint(
-        datapoint={"pairingID": 48, "value": "57"}
-    )
+    room_temperature_controller._refresh_state_from_datapoint(pairing_id=48, value="57")
     assert room_temperature_controller.heating == 57
 
     # Check output that affects the heating with a float value
     room_temperature_controller._refresh_state_from_datapoint(
-        datapoint={"pairingID": 48, "value": "5.7"}
+        pairing_id=48, value="5.7"
     )
     assert room_temperature_controller.heating == 5
 
     # Check output that reports an empty string for cooling
-    room_temperature_controller._refresh_state_from_datapoint(
-        datapoint={"pairingID": 50, "value": ""}
-    )
+    room_temperature_controller._refresh_state_from_datapoint(pairing_id=50, value="")
     assert room_temperature_controller.cooling == 0
 
     # Check output that affects the cooling
-    room_temperature_controller._refresh_state_from_datapoint(
-        datapoint={"pairingID": 50, "value": "57"}
-    )
+    room_temperature_controller._refresh_state_from_datapoint(pairing_id=50, value="57")
     assert room_temperature_controller.cooling == 57
 
     # Check output that affects the cooling with a float value
     room_temperature_controller._refresh_state_from_datapoint(
-        datapoint={"pairingID": 50, "value": "5.7"}
+        pairing_id=50, value="5.7"
     )
     assert room_temperature_controller.cooling == 5
 
     # Check output that does NOT affects the RTC
-    room_temperature_controller._refresh_state_from_datapoint(
-        datapoint={"pairingID": 0, "value": "1"},
-    )
+    room_temperature_controller._refresh_state_from_datapoint(pairing_id=0, value="1")
     assert room_temperature_controller.state is False
     assert room_temperature_controller.target_temperature == 25
     assert room_temperature_controller.eco_mode is True
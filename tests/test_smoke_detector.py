@@ -44,13 +44,11 @@ def smoke_detector(mock_api, mock_device):
     )
 
 
-@pytest.mark.asyncio
 async def test_initial_state(smoke_detector):
     """Test the intial state of the smoke-detector."""
     assert smoke_detector.state is False
 
 
-@pytest.mark.asyncio
 async def test_refresh_state(smoke_detector):
     """Test refreshing the state of the smoke-detector."""
     smoke_detector.device.api.get_datapoint.return_value = ["1"]
@@ -66,13 +64,9 @@ async def test_refresh_state(smoke_detector):
 def test_refresh_state_from_datapoint(smoke_detector):
     """Test the _refresh_state_from_datapoint function."""
     # Check output that affects the state.
-    smoke_detector._refresh_state_from_datapoint(
-        datapoint={"pairingID": 707, "value": "1"},
-    )
+    smoke_detector._refresh_state_from_datapoint(pairing_id=707, value="1")
     assert smoke_detector.state is True
 
     # Check output that does NOT affect the state.
-    smoke_detector._refresh_state_from_datapoint(
-        datapoint={"pairingID": 4, "value": "1"},
-    )
+    smoke_detector._refresh_state_from_datapoint(pairing_id=4, value="1")
     assert smoke_detector.state is True
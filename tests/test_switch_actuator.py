@@ -53,13 +53,11 @@ def switch_actuator(mock_api, mock_device):
     )
 
 
-@pytest.mark.asyncio
 async def test_initial_state(switch_actuator):
     """Test the intial state of the switch."""
     assert switch_actuator.state is False
 
 
-@pytest.mark.asyncio
 async def test_turn_on(switch_actuator):
     """Test to turning on of the switch."""
     await switch_actuator.turn_on()
@@ -72,7 +70,6 @@ async def test_turn_on(switch_actuator):
     )
 
 
-@pytest.mark.asyncio
 async def test_turn_off(switch_actuator):
     """Test to turning off of the switch."""
     await switch_actuator.turn_off()
@@ -85,7 +82,6 @@ async def test_turn_off(switch_actuator):
     )
 
 
-@pytest.mark.asyncio
 async def test_set_forced(switch_actuator):
     """Test to set the forced option of the switch."""
     await switch_actuator.set_forced_position(
@@ -129,7 +125,6 @@ async def test_set_forced(switch_actuator):
     assert switch_actuator.forced_position == SwitchActuatorForcedPosition.unknown.name
 
 
-@pytest.mark.asyncio
 async def test_refresh_state(switch_actuator):
     """Test refreshing the state of the switch."""
     switch_actuator.device.api.get_datapoint.return_value = ["1"]
@@ -106,13 +106,11 @@ def dimming_sensor(mock_api, mock_device):
     )
 
 
-@pytest.mark.asyncio
 async def test_initial_state(switch_sensor_with_led):
     """Test the intial state of the switch-sensor."""
     assert switch_sensor_with_led.state == SwitchSensorState.off.name
 
 
-@pytest.mark.asyncio
 async def test_turn_on_led(switch_sensor_with_led):
     """Test to turning on the led of the sensor."""
     await switch_sensor_with_led.turn_on_led()
@@ -125,7 +123,6 @@ async def test_turn_on_led(switch_sensor_with_led):
     )
 
 
-@pytest.mark.asyncio
 async def test_turn_off_led(switch_sensor_with_led):
     """Test to turning off the led of the sensor."""
     await switch_sensor_with_led.turn_off_led()
@@ -138,7 +135,6 @@ async def test_turn_off_led(switch_sensor_with_led):
     )
 
 
-@pytest.mark.asyncio
 async def test_refresh_state_with_led(switch_sensor_with_led):
     """Test refreshing the state of the switch-sensor."""
     switch_sensor_with_led.device.api.get_datapoint.return_value = ["1"]
@@ -151,7 +147,6 @@ async def test_refresh_state_with_led(switch_sensor_with_led):
     )
 
 
-@pytest.mark.asyncio
 async def test_refresh_state_without_led(switch_sensor_without_led):
     """Test refreshing the state of the switch-sensor."""
     switch_sensor_without_led.device.api.get_datapoint.return_value = ["1"]
@@ -167,56 +162,40 @@ async def test_refresh_state_without_led(switch_sensor_without_led):
 def test_refresh_state_from_datapoint_switch(switch_sensor_with_led):
     """Test the _refresh_state_from_datapoint function."""
     # Check output that affects the state.
-    switch_sensor_with_led._refresh_state_from_datapoint(
-        datapoint={"pairingID": 1, "value": "1"},
-    )
+    switch_sensor_with_led._refresh_state_from_datapoint(pairing_id=1, value="1")
     assert switch_sensor_with_led.state == SwitchSensorState.on.name
 
-    switch_sensor_with_led._refresh_state_from_datapoint(
-        datapoint={"pairingID": 1, "value": "INVALID"},
-    )
+    switch_sensor_with_led._refresh_state_from_datapoint(pairing_id=1, value="INVALID")
     assert switch_sensor_with_led.state == SwitchSensorState.unknown.name
 
 
 def test_refresh_state_from_datapoint_dimming(dimming_sensor):
     """Test the _refresh_state_from_datapoint function."""
     # Check output that affects the state.
-    dimming_sensor._refresh_state_from_datapoint(
-        datapoint={"pairingID": 1, "value": "1"},
-    )
+    dimming_sensor._refresh_state_from_datapoint(pairing_id=1, value="1")
     assert dimming_sensor.state == SwitchSensorState.on.name
     assert dimming_sensor.switching_state == SwitchSensorState.on.name
 
-    dimming_sensor._refresh_state_from_datapoint(
-        datapoint={"pairingID": 1, "value": "0"},
-    )
+    dimming_sensor._refresh_state_from_datapoint(pairing_id=1, value="0")
     assert dimming_sensor.state == SwitchSensorState.off.name
     assert dimming_sensor.switching_state == SwitchSensorState.off.name
 
-    dimming_sensor._refresh_state_from_datapoint(
-        datapoint={"pairingID": 16, "value": "1"},
-    )
+    dimming_sensor._refresh_state_from_datapoint(pairing_id=16, value="1")
     assert dimming_sensor.state == DimmingSensorState.longpress_down.name
     assert dimming_sensor.dimming_state == DimmingSensorState.longpress_down.name
 
-    dimming_sensor._refresh_state_from_datapoint(
-        datapoint={"pairingID": 16, "value": "0"},
-    )
+    dimming_sensor._refresh_state_from_datapoint(pairing_id=16, value="0")
 
     assert dimming_sensor.state == DimmingSensorState.longpress_down_release.name
     assert (
         dimming_sensor.dimming_state == DimmingSensorState.longpress_down_release.name
     )
 
-    dimming_sensor._refresh_state_from_datapoint(
-        datapoint={"pairingID": 16, "value": "9"},
-    )
+    dimming_sensor._refresh_state_from_datapoint(pairing_id=16, value="9")
     assert dimming_sensor.state == DimmingSensorState.longpress_up.name
     assert dimming_sensor.dimming_state == DimmingSensorState.longpress_up.name
 
-    dimming_sensor._refresh_state_from_datapoint(
-        datapoint={"pairingID": 16, "value": "8"},
-    )
+    dimming_sensor._refresh_state_from_datapoint(pairing_id=16, value="8")
     assert dimming_sensor.state == DimmingSensorState.longpress_up_release.name
     assert dimming_sensor.dimming_state == DimmingSensorState.longpress_up_release.name
 
@@ -1,16 +1,23 @@
 """Test class to test the TemperatureSensor channel."""
 
-from unittest.mock import AsyncMock, MagicMock
+from types import SimpleNamespace
+from unittest.mock import Mock
 
 import pytest
 
-from src.abbfreeathome.api import FreeAtHomeApi
 from src.abbfreeathome.channels.temperature_sensor import TemperatureSensor
-from src.abbfreeathome.device import Device
+from tests.conftest import FakeApi
 
 
-def get_temperature_sensor(mock_api, mock_device):
-    """Get the TemperatureSensor class to be tested against."""
+@pytest.fixture(scope="module")
+def mock_api():
+    """Create a mock api function."""
+    return FakeApi()
+
+
+@pytest.fixture(scope="module")
+def temperature_sensor(mock_api, mock_device):
+    """Set up the instance for testing the TemperatureSensor channel."""
     inputs = {}
     outputs = {
         "odp0000": {"pairingID": 38, "value": "0"},
@@ -19,6 +26,9 @@ def get_temperature_sensor(mock_api, mock_device):
     }
     parameters = {"par002d": "4", "par0047": "7", "par0048": "7"}
 
+    mock_device.device_serial = "7EB1000021C5"
+
+    mock_device.api = mock_api
     return TemperatureSensor(
         device=mock_device,
         channel_id="ch0002",
@@ -29,35 +39,28 @@ def get_temperature_sensor(mock_api, mock_device):
     )
 
 
-@pytest.fixture
-def mock_api():
-    """Create a mock api function."""
-    return AsyncMock(spec=FreeAtHomeApi)
-
-
-@pytest.fixture
-def temperature_sensor(mock_api, mock_device):
-    """Set up the instance for testing the TemperatureSensor channel."""
-    mock_device.device_serial = "7EB1000021C5"
-
-    mock_device.api = mock_api
-    return get_temperature_sensor(mock_api, mock_device)
-
-
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mock_device():
     """Create a mock device function."""
-    return MagicMock(spec=Device)
+    return SimpleNamespace(device_serial=None, api=None)
+
+
+@pytest.fixture(autouse=True)
+def _reset_temperature_sensor(temperature_sensor):
+    """Reset the module-scoped sensor state between tests."""
+    temperature_sensor._state = 15.5
+    temperature_sensor._alarm = False
+    temperature_sensor.device.api.get_datapoint.reset_mock(
+        return_value=True, side_effect=True
+    )
 
 
-@pytest.mark.asyncio
 async def test_initial_state(temperature_sensor):
     """Test the intial state of the sensor."""
     assert temperature_sensor.state == 15.50
     assert temperature_sensor.alarm is False
 
 
-@pytest.mark.asyncio
 async def test_refresh_state(temperature_sensor):
     """Test refreshing the state of the sensor."""
     temperature_sensor.device.api.get_datapoint.return_value = ["1"]
@@ -74,19 +77,40 @@ async def test_refresh_state(temperature_sensor):
 def test_refresh_state_from_datapoint(temperature_sensor):
     """Test the _refresh_state_from_datapoint function."""
     # Check output that affects the state.
-    temperature_sensor._refresh_state_from_datapoint(
-        datapoint={"pairingID": 1024, "value": "20.1"},
-    )
+    temperature_sensor._refresh_state_from_datapoint(pairing_id=1024, value="20.1")
     assert temperature_sensor.state == 20.1
 
     # Check output that affects the state.
-    temperature_sensor._refresh_state_from_datapoint(
-        datapoint={"pairingID": 38, "value": "1"},
-    )
+    temperature_sensor._refresh_state_from_datapoint(pairing_id=38, value="1")
     assert temperature_sensor.alarm is True
 
     # Check output that does NOT affect the state.
-    temperature_sensor._refresh_state_from_datapoint(
-        datapoint={"pairingID": 4, "value": "1"},
-    )
+    temperature_sensor._refresh_state_from_datapoint(pairing_id=4, value="1")
+    assert temperature_sensor.state == 20.1
+
+
+def test_refresh_state_idempotent(temperature_sensor):
+    """Test repeated datapoints don't fire spurious callbacks."""
+    callback = Mock()
+    temperature_sensor.register_callback(callback_attribute="state", callback=callback)
+
+    temperature_sensor.update_channel("AL_OUTDOOR_TEMPERATURE/odp0001", "20.1")
+    temperature_sensor.update_channel("AL_OUTDOOR_TEMPERATURE/odp0001", "20.1")
+
     assert temperature_sensor.state == 20.1
+    callback.assert_called_once()
+    temperature_sensor.remove_callback(callback_attribute="state", callback=callback)
+
+    alarm_callback = Mock()
+    temperature_sensor.register_callback(
+        callback_attribute="alarm", callback=alarm_callback
+    )
+
+    temperature_sensor.update_channel("AL_FROST_ALARM/odp0000", "1")
+    temperature_sensor.update_channel("AL_FROST_ALARM/odp0000", "1")
+
+    assert temperature_sensor.alarm is True
+    alarm_callback.assert_called_once()
+    temperature_sensor.remove_callback(
+        callback_attribute="alarm", callback=alarm_callback
+    )
@@ -44,7 +44,6 @@ def trigger(mock_api, mock_device):
     )
 
 
-@pytest.mark.asyncio
 async def test_press(trigger):
     """Test to press the trigger."""
     await trigger.press()
@@ -47,7 +47,6 @@ def virtual_brightness_sensor(mock_api, mock_device):
     )
 
 
-@pytest.mark.asyncio
 async def test_turn_on(virtual_brightness_sensor):
     """Test to activate the sensor."""
     await virtual_brightness_sensor.turn_on()
@@ -60,7 +59,6 @@ async def test_turn_on(virtual_brightness_sensor):
     assert virtual_brightness_sensor.alarm is True
 
 
-@pytest.mark.asyncio
 async def test_turn_off(virtual_brightness_sensor):
     """Test to deactivate the sensor."""
     await virtual_brightness_sensor.turn_off()
@@ -73,7 +71,6 @@ async def test_turn_off(virtual_brightness_sensor):
     assert virtual_brightness_sensor.alarm is False
 
 
-@pytest.mark.asyncio
 async def test_set_brightness(virtual_brightness_sensor):
     """Test to set brightness of the sensor."""
     """Values greather 0 should always work"""
@@ -51,7 +51,6 @@ def virtual_energy_battery(mock_api, mock_device):
     )
 
 
-@pytest.mark.asyncio
 async def test_set_battery_power(virtual_energy_battery):
     """Test to set battery_power of the sensor."""
     await virtual_energy_battery.set_battery_power(435.7)
@@ -64,7 +63,6 @@ async def test_set_battery_power(virtual_energy_battery):
     assert virtual_energy_battery.battery_power == 435.7
 
 
-@pytest.mark.asyncio
 async def test_set_soc(virtual_energy_battery):
     """Test to set soc of the sensor."""
     """between 0 and 100 is ok"""
@@ -108,7 +106,6 @@ async def test_set_soc(virtual_energy_battery):
     assert virtual_energy_battery.soc == 100
 
 
-@pytest.mark.asyncio
 async def test_set_imported_today(virtual_energy_battery):
     """Test to set imported_today of the sensor."""
     """Values greater 0 should always work"""
@@ -142,7 +139,6 @@ async def test_set_imported_today(virtual_energy_battery):
     assert virtual_energy_battery.imported_today == 0
 
 
-@pytest.mark.asyncio
 async def test_set_exported_today(virtual_energy_battery):
     """Test to set exported_today of the sensor."""
     """Values greater 0 should always work"""
@@ -176,7 +172,6 @@ async def test_set_exported_today(virtual_energy_battery):
     assert virtual_energy_battery.exported_today == 0
 
 
-@pytest.mark.asyncio
 async def test_set_imported_total(virtual_energy_battery):
     """Test to set imported_total of the sensor."""
     """Values greater 0 should always work"""
@@ -210,7 +205,6 @@ async def test_set_imported_total(virtual_energy_battery):
     assert virtual_energy_battery.imported_total == 0
 
 
-@pytest.mark.asyncio
 async def test_set_exported_total(virtual_energy_battery):
     """Test to set exported_total of the sensor."""
     """Values greater 0 should always work"""
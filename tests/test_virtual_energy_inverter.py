@@ -49,7 +49,6 @@ def virtual_energy_inverter(mock_api, mock_device):
     )
 
 
-@pytest.mark.asyncio
 async def test_set_current_power(virtual_energy_inverter):
     """Test to set current_power of the sensor."""
     await virtual_energy_inverter.set_current_power(435.7)
@@ -62,7 +61,6 @@ async def test_set_current_power(virtual_energy_inverter):
     assert virtual_energy_inverter.current_power == 435.7
 
 
-@pytest.mark.asyncio
 async def test_set_imported_today(virtual_energy_inverter):
     """Test to set imported_today of the sensor."""
     """Values greater 0 should always work"""
@@ -96,7 +94,6 @@ async def test_set_imported_today(virtual_energy_inverter):
     assert virtual_energy_inverter.imported_today == 0
 
 
-@pytest.mark.asyncio
 async def test_set_imported_total(virtual_energy_inverter):
     """Test to set imported_total of the sensor."""
     """Values greater 0 should always work"""
@@ -52,7 +52,6 @@ def virtual_energy_two_way_meter(mock_api, mock_device):
     )
 
 
-@pytest.mark.asyncio
 async def test_set_current_power(virtual_energy_two_way_meter):
     """Test to set battery_power of the sensor."""
     await virtual_energy_two_way_meter.set_current_power(435.7)
@@ -65,7 +64,6 @@ async def test_set_current_power(virtual_energy_two_way_meter):
     assert virtual_energy_two_way_meter.current_power == 435.7
 
 
-@pytest.mark.asyncio
 async def test_set_imported_today(virtual_energy_two_way_meter):
     """Test to set imported_today of the sensor."""
     """Values greater 0 should always work"""
@@ -99,7 +97,6 @@ async def test_set_imported_today(virtual_energy_two_way_meter):
     assert virtual_energy_two_way_meter.imported_today == 0
 
 
-@pytest.mark.asyncio
 async def test_set_exported_today(virtual_energy_two_way_meter):
     """Test to set exported_today of the sensor."""
     """Values greater 0 should always work"""
@@ -133,7 +130,6 @@ async def test_set_exported_today(virtual_energy_two_way_meter):
     assert virtual_energy_two_way_meter.exported_today == 0
 
 
-@pytest.mark.asyncio
 async def test_set_imported_total(virtual_energy_two_way_meter):
     """Test to set imported_total of the sensor."""
     """Values greater 0 should always work"""
@@ -167,7 +163,6 @@ async def test_set_imported_total(virtual_energy_two_way_meter):
     assert virtual_energy_two_way_meter.imported_total == 0
 
 
-@pytest.mark.asyncio
 async def test_set_exported_total(virtual_energy_two_way_meter):
     """Test to set exported_total of the sensor."""
     """Values greater 0 should always work"""
@@ -46,7 +46,6 @@ def virtual_rain_sensor(mock_api, mock_device):
     )
 
 
-@pytest.mark.asyncio
 async def test_turn_on(virtual_rain_sensor):
     """Test to activate the sensor."""
     await virtual_rain_sensor.turn_on()
@@ -59,7 +58,6 @@ async def test_turn_on(virtual_rain_sensor):
     assert virtual_rain_sensor.alarm is True
 
 
-@pytest.mark.asyncio
 async def test_turn_off(virtual_rain_sensor):
     """Test to deactivate the sensor."""
     await virtual_rain_sensor.turn_off()
@@ -53,13 +53,11 @@ def virtual_room_temperature_controller(mock_api, mock_device):
     )
 
 
-@pytest.mark.asyncio
 async def test_initial_state(virtual_room_temperature_controller):
     """Test the intial state of the virtual controller."""
     assert virtual_room_temperature_controller.state is False
 
 
-@pytest.mark.asyncio
 async def test_turn_on(virtual_room_temperature_controller):
     """Test to turning on of the controller."""
     await virtual_room_temperature_controller.turn_on()
@@ -72,7 +70,6 @@ async def test_turn_on(virtual_room_temperature_controller):
     )
 
 
-@pytest.mark.asyncio
 async def test_turn_off(virtual_room_temperature_controller):
     """Test to turning off of the switch."""
     await virtual_room_temperature_controller.turn_off()
@@ -85,7 +82,6 @@ async def test_turn_off(virtual_room_temperature_controller):
     )
 
 
-@pytest.mark.asyncio
 async def test_turn_on_eco_mode(virtual_room_temperature_controller):
     """Test to turning on the eco-mode of the controller."""
     await virtual_room_temperature_controller.turn_on_eco_mode()
@@ -98,7 +94,6 @@ async def test_turn_on_eco_mode(virtual_room_temperature_controller):
     )
 
 
-@pytest.mark.asyncio
 async def test_turn_off_eco_mode(virtual_room_temperature_controller):
     """Test to turning off the eco-mode of the switch."""
     await virtual_room_temperature_controller.turn_off_eco_mode()
@@ -111,7 +106,6 @@ async def test_turn_off_eco_mode(virtual_room_temperature_controller):
     )
 
 
-@pytest.mark.asyncio
 async def test_set_target_temperature(virtual_room_temperature_controller):
     """Test to set target temperature of the sensor."""
     await virtual_room_temperature_controller.set_target_temperature(20)
@@ -142,7 +136,6 @@ async def test_set_target_temperature(virtual_room_temperature_controller):
     assert virtual_room_temperature_controller.target_temperature == 35
 
 
-@pytest.mark.asyncio
 async def test_set_current_temperature(virtual_room_temperature_controller):
     """Test to set current temperature of the sensor."""
     await virtual_room_temperature_controller.set_current_temperature(20)
@@ -155,7 +148,6 @@ async def test_set_current_temperature(virtual_room_temperature_controller):
     assert virtual_room_temperature_controller.current_temperature == 20
 
 
-@pytest.mark.asyncio
 async def test_refresh_state(virtual_room_temperature_controller):
     """Test refreshing the state of the controller."""
     virtual_room_temperature_controller.device.api.get_datapoint.return_value = ["20"]
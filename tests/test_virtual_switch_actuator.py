@@ -52,13 +52,11 @@ def virtual_switch_actuator(mock_api, mock_device):
     )
 
 
-@pytest.mark.asyncio
 async def test_initial_state(virtual_switch_actuator):
     """Test the intial state of the virtual switch."""
     assert virtual_switch_actuator.state is False
 
 
-@pytest.mark.asyncio
 async def test_turn_on(virtual_switch_actuator):
     """Test to turning on of the switch."""
     await virtual_switch_actuator.turn_on()
@@ -71,7 +69,6 @@ async def test_turn_on(virtual_switch_actuator):
     )
 
 
-@pytest.mark.asyncio
 async def test_turn_off(virtual_switch_actuator):
     """Test to turning off of the switch."""
     await virtual_switch_actuator.turn_off()
@@ -84,7 +81,6 @@ async def test_turn_off(virtual_switch_actuator):
     )
 
 
-@pytest.mark.asyncio
 async def test_refresh_state(virtual_switch_actuator):
     """Test refreshing the state of the switch."""
     virtual_switch_actuator.device.api.get_datapoint.return_value = ["1"]
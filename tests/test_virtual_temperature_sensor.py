@@ -47,7 +47,6 @@ def virtual_temperature_sensor(mock_api, mock_device):
     )
 
 
-@pytest.mark.asyncio
 async def test_turn_on(virtual_temperature_sensor):
     """Test to activate the sensor."""
     await virtual_temperature_sensor.turn_on()
@@ -60,7 +59,6 @@ async def test_turn_on(virtual_temperature_sensor):
     assert virtual_temperature_sensor.alarm is True
 
 
-@pytest.mark.asyncio
 async def test_turn_off(virtual_temperature_sensor):
     """Test to deactivate the sensor."""
     await virtual_temperature_sensor.turn_off()
@@ -73,7 +71,6 @@ async def test_turn_off(virtual_temperature_sensor):
     assert virtual_temperature_sensor.alarm is False
 
 
-@pytest.mark.asyncio
 async def test_set_temperature(virtual_temperature_sensor):
     """Test to set temperature of the sensor."""
     await virtual_temperature_sensor.set_temperature(-15.6)
@@ -46,7 +46,6 @@ def virtual_wind_sensor(mock_api, mock_device):
     )
 
 
-@pytest.mark.asyncio
 async def test_turn_on(virtual_wind_sensor):
     """Test to activate the sensor."""
     await virtual_wind_sensor.turn_on()
@@ -59,7 +58,6 @@ async def test_turn_on(virtual_wind_sensor):
     assert virtual_wind_sensor.alarm is True
 
 
-@pytest.mark.asyncio
 async def test_turn_off(virtual_wind_sensor):
     """Test to deactivate the sensor."""
     await virtual_wind_sensor.turn_off()
@@ -72,7 +70,6 @@ async def test_turn_off(virtual_wind_sensor):
     assert virtual_wind_sensor.alarm is False
 
 
-@pytest.mark.asyncio
 async def test_set_speed(virtual_wind_sensor):
     """Test to set speed of the sensor."""
     """Greater than 0 is ok"""
@@ -96,7 +93,6 @@ async def test_set_speed(virtual_wind_sensor):
     assert virtual_wind_sensor.speed == 0.0
 
 
-@pytest.mark.asyncio
 async def test_set_force(virtual_wind_sensor):
     """Test to set force of the sensor."""
     """between 0 and 12 is ok"""
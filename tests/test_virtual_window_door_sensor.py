@@ -46,7 +46,6 @@ def virtual_window_door_sensor(mock_api, mock_device):
     )
 
 
-@pytest.mark.asyncio
 async def test_turn_on(virtual_window_door_sensor):
     """Test to activate the sensor."""
     await virtual_window_door_sensor.turn_on()
@@ -59,7 +58,6 @@ async def test_turn_on(virtual_window_door_sensor):
     assert virtual_window_door_sensor.state is True
 
 
-@pytest.mark.asyncio
 async def test_turn_off(virtual_window_door_sensor):
     """Test to deactivate the sensor."""
     await virtual_window_door_sensor.turn_off()
@@ -51,7 +51,6 @@ def mock_device():
     return MagicMock(spec=Device)
 
 
-@pytest.mark.asyncio
 async def test_initial_state(wind_sensor):
     """Test the intial state of the sensor."""
     assert wind_sensor.state == 10.3
@@ -59,7 +58,6 @@ async def test_initial_state(wind_sensor):
     assert wind_sensor.force == 3
 
 
-@pytest.mark.asyncio
 async def test_refresh_state(wind_sensor):
     """Test refreshing the state of the sensor."""
     wind_sensor.device.api.get_datapoint.return_value = ["1"]
@@ -77,25 +75,17 @@ async def test_refresh_state(wind_sensor):
 def test_refresh_state_from_datapoint(wind_sensor):
     """Test the _refresh_state_from_datapoint function."""
     # Check output that affects the state.
-    wind_sensor._refresh_state_from_datapoint(
-        datapoint={"pairingID": 1028, "value": "20.1"},
-    )
+    wind_sensor._refresh_state_from_datapoint(pairing_id=1028, value="20.1")
     assert wind_sensor.state == 20.1
 
     # Check output that affects the state.
-    wind_sensor._refresh_state_from_datapoint(
-        datapoint={"pairingID": 37, "value": "1"},
-    )
+    wind_sensor._refresh_state_from_datapoint(pairing_id=37, value="1")
     assert wind_sensor.alarm is True
 
     # Check output that affects the state.
-    wind_sensor._refresh_state_from_datapoint(
-        datapoint={"pairingID": 1025, "value": "2"},
-    )
+    wind_sensor._refresh_state_from_datapoint(pairing_id=1025, value="2")
     assert wind_sensor.force == 2
 
     # Check output that does NOT affect the state.
-    wind_sensor._refresh_state_from_datapoint(
-        datapoint={"pairingID": 4, "value": "1"},
-    )
+    wind_sensor._refresh_state_from_datapoint(pairing_id=4, value="1")
     assert wind_sensor.state == 20.1
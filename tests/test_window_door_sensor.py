@@ -45,14 +45,12 @@ def window_door_sensor(mock_api, mock_device):
     )
 
 
-@pytest.mark.asyncio
 async def test_initial_state(window_door_sensor):
     """Test the intial state of the window-door-sensor."""
     assert window_door_sensor.state is True
     assert window_door_sensor.position == "tilted"
 
 
-@pytest.mark.asyncio
 async def test_refresh_state(window_door_sensor):
     """Test refreshing the state of the window-door-sensor."""
     window_door_sensor.device.api.get_datapoint.return_value = ["1"]
@@ -68,23 +66,15 @@ async def test_refresh_state(window_door_sensor):
 def test_refresh_state_from_datapoint(window_door_sensor):
     """Test the _refresh_state_from_datapoint function."""
     # Check output that affects the state.
-    window_door_sensor._refresh_state_from_datapoint(
-        datapoint={"pairingID": 53, "value": "0"},
-    )
+    window_door_sensor._refresh_state_from_datapoint(pairing_id=53, value="0")
     assert window_door_sensor.state is False
 
-    window_door_sensor._refresh_state_from_datapoint(
-        datapoint={"pairingID": 41, "value": "100"},
-    )
+    window_door_sensor._refresh_state_from_datapoint(pairing_id=41, value="100")
     assert window_door_sensor.position == "open"
 
-    window_door_sensor._refresh_state_from_datapoint(
-        datapoint={"pairingID": 41, "value": "NOTVALID"},
-    )
+    window_door_sensor._refresh_state_from_datapoint(pairing_id=41, value="NOTVALID")
     assert window_door_sensor.position == "unknown"
 
     # Check output that NOT affects the state.
-    window_door_sensor._refresh_state_from_datapoint(
-        datapoint={"pairingID": 0, "value": "1"},
-    )
+    window_door_sensor._refresh_state_from_datapoint(pairing_id=0, value="1")
     assert window_door_sensor.state is False